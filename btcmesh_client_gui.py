@@ -136,7 +136,7 @@ STATE_CONNECTION_FAILED = ConnectionState('Meshtastic: Connection failed', COLOR
 STATE_CONNECTION_ERROR = ConnectionState('Meshtastic: Error', COLOR_ERROR)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultAction:
     """Represents the actions to take in response to a result from a background thread.
 
@@ -160,134 +160,171 @@ class ResultAction:
     store_iface: Optional[Any] = None
 
 
-def process_result(result: tuple) -> ResultAction:
-    """Process a result tuple and return the actions to take.
+def _handle_connected(action: ResultAction, result: tuple) -> None:
+    iface = result[1]
+    node_id = result[2]
+    node_name = result[3] if len(result) > 3 else None
+    action.store_iface = iface
+    if node_name:
+        action.connection_text = f'Meshtastic: Connected - {node_name} ({node_id})'
+        action.log_messages.append((f"Connected to Meshtastic device: {node_name} ({node_id})", COLOR_SUCCESS))
+    else:
+        action.connection_text = f'Meshtastic: Connected ({node_id})'
+        action.log_messages.append((f"Connected to Meshtastic device: {node_id}", COLOR_SUCCESS))
+    action.connection_color = COLOR_SUCCESS
 
-    This is a pure function that determines what GUI actions should be performed
-    based on the result, without actually performing them.
 
-    Args:
-        result: A tuple where result[0] is the result type string
+def _handle_connection_failed(action: ResultAction, result: tuple) -> None:
+    action.connection_text = STATE_CONNECTION_FAILED.text
+    action.connection_color = STATE_CONNECTION_FAILED.color
+    # Use specific error message if provided, otherwise generic message
+    error_msg = result[1] if len(result) > 1 and result[1] else "Failed to connect to Meshtastic device"
+    action.log_messages.append((error_msg, COLOR_ERROR))
 
-    Returns:
-        A ResultAction describing what GUI updates to make
-    """
-    action = ResultAction()
-    result_type = result[0]
-
-    if result_type == 'connected':
-        iface = result[1]
-        node_id = result[2]
-        node_name = result[3] if len(result) > 3 else None
-        action.store_iface = iface
-        if node_name:
-            action.connection_text = f'Meshtastic: Connected - {node_name} ({node_id})'
-            action.log_messages.append((f"Connected to Meshtastic device: {node_name} ({node_id})", COLOR_SUCCESS))
-        else:
-            action.connection_text = f'Meshtastic: Connected ({node_id})'
-            action.log_messages.append((f"Connected to Meshtastic device: {node_id}", COLOR_SUCCESS))
-        action.connection_color = COLOR_SUCCESS
-
-    elif result_type == 'connection_failed':
-        action.connection_text = STATE_CONNECTION_FAILED.text
-        action.connection_color = STATE_CONNECTION_FAILED.color
-        # Use specific error message if provided, otherwise generic message
-        error_msg = result[1] if len(result) > 1 and result[1] else "Failed to connect to Meshtastic device"
-        action.log_messages.append((error_msg, COLOR_ERROR))
-
-    elif result_type == 'connection_error':
-        error = result[1]
-        action.connection_text = STATE_CONNECTION_ERROR.text
-        action.connection_color = STATE_CONNECTION_ERROR.color
-        action.log_messages.append((f"Connection error: {error}", COLOR_ERROR))
-
-    elif result_type == 'connection_initializing':
-        # Device is still initializing - show informational message
-        action.log_messages.append(("Device is initializing, please wait...", COLOR_WARNING))
-        action.connection_text = 'Meshtastic: Initializing...'
-        action.connection_color = COLOR_WARNING
-
-    elif result_type == 'log':
-        msg = result[1]
-        level = result[2]
-        color = get_log_color(level, msg)
-        action.log_messages.append((msg, color))
-
-    elif result_type == 'print':
-        # Old CLI result type - kept for backwards compatibility, will be removed in Step 7
-        msg = result[1]
-        color = get_print_color(msg)
-        action.log_messages.append((msg, color))
-
-        # Detect success message with TXID and trigger popup
-        if 'TXID:' in msg and 'successfully' in msg.lower():
-            txid_start = msg.find('TXID:') + 5
-            txid = msg[txid_start:].strip().split()[0] if txid_start > 5 else 'Unknown'
-            action.show_success_popup = txid
-            action.stop_sending = True
-
-    elif result_type == 'chunk_sending':
-        chunk_num, total, attempt = result[1], result[2], result[3]
-        if attempt > 1:
-            msg = f'Sending chunk {chunk_num}/{total} (retry {attempt - 1})...'
-        else:
-            msg = f'Sending chunk {chunk_num}/{total}...'
-        action.log_messages.append((msg, COLOR_PRIMARY))
 
-    elif result_type == 'wire_sent':
-        wire_format = result[1]
-        action.log_messages.append((f'  -> {wire_format}', COLOR_SECUNDARY))
+def _handle_connection_error(action: ResultAction, result: tuple) -> None:
+    error = result[1]
+    action.connection_text = STATE_CONNECTION_ERROR.text
+    action.connection_color = STATE_CONNECTION_ERROR.color
+    action.log_messages.append((f"Connection error: {error}", COLOR_ERROR))
 
-    elif result_type == 'progress':
-        chunk_num, total = result[1], result[2]
-        if chunk_num == total:
-            msg = f'Chunk {chunk_num}/{total} sent — waiting for broadcast...'
-        else:
-            msg = f'Chunk {chunk_num}/{total} sent'
-        action.log_messages.append((msg, COLOR_PRIMARY))
-
-    elif result_type == 'wire_received':
-        message_text = result[1]
-        action.log_messages.append((f'  <- {message_text}', COLOR_SECUNDARY))
-
-    elif result_type == 'send_result':
-        send_result = result[1]
-        if send_result.success:
-            action.show_success_popup = send_result.txid
-            action.stop_sending = True
-        elif send_result.error == "Aborted by user":
-            action.log_messages.append(('Transaction aborted by user', COLOR_WARNING))
-            action.stop_sending = True
-        else:
-            action.log_messages.append((f'Error: {send_result.error}', COLOR_ERROR))
-            action.stop_sending = True
-
-    elif result_type == 'cli_finished':
-        # Old CLI result type - kept for backwards compatibility, will be removed in Step 7
-        exit_code = result[1]
-        if exit_code == 0:
-            action.log_messages.append(("Transaction completed successfully!", COLOR_SUCCESS))
-        else:
-            action.log_messages.append((f"CLI exited with code {exit_code}", COLOR_ERROR))
-        action.stop_sending = True
 
-    elif result_type == 'tx_success':
-        # Old result type - kept for backwards compatibility, will be removed in Step 7
-        txid = result[1]
-        action.log_messages.append(("Transaction broadcast successful!", COLOR_SUCCESS))
-        action.log_messages.append((f"TXID: {txid}", COLOR_SUCCESS))
+def _handle_connection_initializing(action: ResultAction, result: tuple) -> None:
+    # Device is still initializing - show informational message
+    action.log_messages.append(("Device is initializing, please wait...", COLOR_WARNING))
+    action.connection_text = 'Meshtastic: Initializing...'
+    action.connection_color = COLOR_WARNING
+
+
+def _handle_log(action: ResultAction, result: tuple) -> None:
+    msg = result[1]
+    level = result[2]
+    color = get_log_color(level, msg)
+    action.log_messages.append((msg, color))
+
+
+def _handle_print(action: ResultAction, result: tuple) -> None:
+    # Old CLI result type - kept for backwards compatibility, will be removed in Step 7
+    msg = result[1]
+    color = get_print_color(msg)
+    action.log_messages.append((msg, color))
+
+    # Detect success message with TXID and trigger popup
+    if 'TXID:' in msg and 'successfully' in msg.lower():
+        txid_start = msg.find('TXID:') + 5
+        txid = msg[txid_start:].strip().split()[0] if txid_start > 5 else 'Unknown'
         action.show_success_popup = txid
         action.stop_sending = True
 
-    elif result_type == 'error':
-        error = result[1]
-        action.log_messages.append((f"Error: {error}", COLOR_ERROR))
-        action.stop_sending = True
 
-    elif result_type == 'aborted':
-        action.log_messages.append(("Transaction aborted by user", COLOR_WARNING))
+def _handle_chunk_sending(action: ResultAction, result: tuple) -> None:
+    chunk_num, total, attempt = result[1], result[2], result[3]
+    if attempt > 1:
+        msg = f'Sending chunk {chunk_num}/{total} (retry {attempt - 1})...'
+    else:
+        msg = f'Sending chunk {chunk_num}/{total}...'
+    action.log_messages.append((msg, COLOR_PRIMARY))
+
+
+def _handle_wire_sent(action: ResultAction, result: tuple) -> None:
+    wire_format = result[1]
+    action.log_messages.append((f'  -> {wire_format}', COLOR_SECUNDARY))
+
+
+def _handle_progress(action: ResultAction, result: tuple) -> None:
+    chunk_num, total = result[1], result[2]
+    if chunk_num == total:
+        msg = f'Chunk {chunk_num}/{total} sent — waiting for broadcast...'
+    else:
+        msg = f'Chunk {chunk_num}/{total} sent'
+    action.log_messages.append((msg, COLOR_PRIMARY))
+
+
+def _handle_wire_received(action: ResultAction, result: tuple) -> None:
+    message_text = result[1]
+    action.log_messages.append((f'  <- {message_text}', COLOR_SECUNDARY))
+
+
+def _handle_send_result(action: ResultAction, result: tuple) -> None:
+    send_result = result[1]
+    if send_result.success:
+        action.show_success_popup = send_result.txid
         action.stop_sending = True
+    elif send_result.error == "Aborted by user":
+        action.log_messages.append(('Transaction aborted by user', COLOR_WARNING))
+        action.stop_sending = True
+    else:
+        action.log_messages.append((f'Error: {send_result.error}', COLOR_ERROR))
+        action.stop_sending = True
+
 
+def _handle_cli_finished(action: ResultAction, result: tuple) -> None:
+    # Old CLI result type - kept for backwards compatibility, will be removed in Step 7
+    exit_code = result[1]
+    if exit_code == 0:
+        action.log_messages.append(("Transaction completed successfully!", COLOR_SUCCESS))
+    else:
+        action.log_messages.append((f"CLI exited with code {exit_code}", COLOR_ERROR))
+    action.stop_sending = True
+
+
+def _handle_tx_success(action: ResultAction, result: tuple) -> None:
+    # Old result type - kept for backwards compatibility, will be removed in Step 7
+    txid = result[1]
+    action.log_messages.append(("Transaction broadcast successful!", COLOR_SUCCESS))
+    action.log_messages.append((f"TXID: {txid}", COLOR_SUCCESS))
+    action.show_success_popup = txid
+    action.stop_sending = True
+
+
+def _handle_error(action: ResultAction, result: tuple) -> None:
+    error = result[1]
+    action.log_messages.append((f"Error: {error}", COLOR_ERROR))
+    action.stop_sending = True
+
+
+def _handle_aborted(action: ResultAction, result: tuple) -> None:
+    action.log_messages.append(("Transaction aborted by user", COLOR_WARNING))
+    action.stop_sending = True
+
+
+# Result type -> handler that fills in the ResultAction for that result
+_RESULT_HANDLERS = {
+    'connected': _handle_connected,
+    'connection_failed': _handle_connection_failed,
+    'connection_error': _handle_connection_error,
+    'connection_initializing': _handle_connection_initializing,
+    'log': _handle_log,
+    'print': _handle_print,
+    'chunk_sending': _handle_chunk_sending,
+    'wire_sent': _handle_wire_sent,
+    'progress': _handle_progress,
+    'wire_received': _handle_wire_received,
+    'send_result': _handle_send_result,
+    'cli_finished': _handle_cli_finished,
+    'tx_success': _handle_tx_success,
+    'error': _handle_error,
+    'aborted': _handle_aborted,
+}
+
+
+def process_result(result: tuple) -> ResultAction:
+    """Process a result tuple and return the actions to take.
+
+    This is a pure function that determines what GUI actions should be performed
+    based on the result, without actually performing them.
+
+    Args:
+        result: A tuple where result[0] is the result type string
+
+    Returns:
+        A ResultAction describing what GUI updates to make (empty for
+        unknown result types)
+    """
+    action = ResultAction()
+    handler = _RESULT_HANDLERS.get(result[0])
+    if handler is not None:
+        handler(action, result)
     return action
 
 
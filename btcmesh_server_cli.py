@@ -112,8 +112,11 @@ def run_server(port=None) -> int:
     # Meshtastic keeps receiving/reassembling/ACKing chunks, only the eventual
     # broadcast step fails once a transaction actually completes.
     try:
-        rpc_client = BitcoinRPCClient(load_bitcoin_rpc_config())
+        rpc_client = BitcoinRPCClient(load_bitcoin_rpc_config(), eager_probe=True)
         server_logger.info(f"Connected to Bitcoin Core RPC node. Chain: {rpc_client.chain}")
+        if rpc_client.use_tor:
+            # Keep the Tor circuit warm between (rare) broadcasts
+            rpc_client.start_keepalive()
     except Exception as e:
         rpc_client = None
         server_logger.error(f"Failed to connect to Bitcoin Core RPC node: {e}. Continuing without RPC connection.")
@@ -157,6 +160,8 @@ def run_server(port=None) -> int:
         server_logger.info("Server shutting down by user request (Ctrl+C).")
     finally:
         transport.disconnect()
+        if rpc_client is not None:
+            rpc_client.close()
     return 0
 
 
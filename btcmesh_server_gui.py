@@ -603,7 +603,7 @@ class BTCMeshServerGUI(BoxLayout):
                     'user': user,
                     'password': password,
                 }
-                client = BitcoinRPCClient(config)
+                client = BitcoinRPCClient(config, eager_probe=True)
                 chain = client.chain
                 tor_suffix = ' via Tor' if is_tor else ''
                 self.result_queue.put(('test_connection_result', True,
@@ -762,8 +762,11 @@ class BTCMeshServerGUI(BoxLayout):
             # once a transaction actually completes, same as the old
             # btcmesh_server.py continuing with bitcoin_rpc=None.
             try:
-                rpc_client = BitcoinRPCClient(rpc_config)
+                rpc_client = BitcoinRPCClient(rpc_config, eager_probe=True)
                 is_tor = rpc_config['host'].endswith('.onion')
+                if is_tor:
+                    # Keep the Tor circuit warm between (rare) broadcasts
+                    rpc_client.start_keepalive()
                 self.result_queue.put((
                     'rpc_connected',
                     {'host': rpc_config['host'], 'is_tor': is_tor, 'chain': rpc_client.chain},
@@ -855,6 +858,8 @@ class BTCMeshServerGUI(BoxLayout):
             except Exception as e:
                 self.result_queue.put(('init_error', str(e)))
                 transport.disconnect()
+                if rpc_client is not None:
+                    rpc_client.close()
                 return
 
             self.result_queue.put(('server_started', None))
@@ -887,6 +892,9 @@ class BTCMeshServerGUI(BoxLayout):
                     time.sleep(1)
             finally:
                 transport.disconnect()
+                if rpc_client is not None:
+                    # Stops the keepalive thread so Start/Stop cycles don't pile them up
+                    rpc_client.close()
                 self.result_queue.put(('server_stopped', None))
 
         self._server_thread = threading.Thread(target=run_server, daemon=True)
@@ -14,6 +14,7 @@ CHUNK_INDEX_DELIMITER = "/"
 # --- Sizing ---
 DEFAULT_CHUNK_SIZE = 170  # hex characters per chunk (85 bytes)
 SESSION_ID_LENGTH = 5  # hex characters in session ID
+MAX_TOTAL_CHUNKS = 5000  # upper bound on chunks per session (~400 kB tx at the default chunk size)
 
 # --- Timeouts (seconds) ---
 DEFAULT_ACK_TIMEOUT = 30  # client waits this long for server ACK
@@ -6,6 +6,7 @@ This module provides device scanning, node information retrieval, and formatting
 functions used by CLI, GUI, and server components.
 """
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Optional, List, Dict
 
 
@@ -168,7 +169,10 @@ def get_known_nodes(iface, exclude_own: bool = True) -> List[Dict]:
         # Skip own node by comparing node_id hex to own_node_num
         if own_node_num is not None:
             try:
-                node_num = int(node_id.lstrip('!'), 16)
+                if node_id.startswith('!'):
+                    node_num = int(node_id[1:], 16)
+                else:
+                    node_num = int(node_id, 16)
                 if node_num == own_node_num:
                     continue
             except (ValueError, AttributeError):
@@ -200,7 +204,7 @@ def get_known_nodes(iface, exclude_own: bool = True) -> List[Dict]:
         })
 
     # Sort by lastHeard descending (most recent first)
-    nodes.sort(key=lambda n: n['lastHeard'], reverse=True)
+    nodes.sort(key=itemgetter('lastHeard'), reverse=True)
 
     return nodes
 
@@ -28,6 +28,7 @@ from core.message_types import (
     NackMessage,
     TransactionSession,
 )
+from core.transaction_parser import is_hex
 
 
 # ---------------------------------------------------------------------------
@@ -40,13 +41,9 @@ def is_valid_hex(s: str) -> bool:
 
     Returns True if s is a non-empty string of hex characters, False otherwise.
     """
-    if not s:
-        return False
-    try:
-        int(s, 16)
-        return True
-    except ValueError:
-        return False
+    # Not int(s, 16): that also accepts a '0x' prefix, '_' separators and
+    # surrounding whitespace, and raises (building a traceback) on failure.
+    return bool(s) and is_hex(s)
 
 
 def validate_transaction_hex(tx_hex: str) -> None:
@@ -10,6 +10,7 @@ from core.constants import (
     CHUNK_DELIMITER,
     CHUNK_INDEX_DELIMITER,
     DEFAULT_REASSEMBLY_TIMEOUT,
+    MAX_TOTAL_CHUNKS,
 )
 
 # Backward-compatibility alias: prefer CHUNK_DELIMITER going forward.
@@ -62,7 +63,8 @@ class TransactionReassembler:
         # {
         #   sender_id_tuple_key: {
         #       tx_session_id: {
-        #           "chunks": {chunk_num: hex_payload_part},
+        #           "chunks": [hex_payload_part or None] * total_chunks,
+        #           "received_count": int,
         #           "total_chunks": Optional[int],
         #           "last_update_time": float,
         #           "sender_id_str": str # For logging/reply purposes
@@ -94,15 +96,18 @@ class TransactionReassembler:
         if not message_text.startswith(CHUNK_PREFIX):
             raise InvalidChunkFormatError(f"Message does not start with {CHUNK_PREFIX}")
 
-        parts = message_text[len(CHUNK_PREFIX) :].split(CHUNK_PARTS_DELIMITER)
-        if len(parts) != 3:
+        # Count delimiters in place before slicing, so malformed traffic is
+        # rejected without allocating any substrings.
+        delimiter_count = message_text.count(CHUNK_PARTS_DELIMITER, len(CHUNK_PREFIX))
+        if delimiter_count != 2:
             raise InvalidChunkFormatError(
-                f"Message does not have 3 parts after prefix: {parts}"
+                f"Message does not have 3 parts after prefix: "
+                f"found {delimiter_count + 1}"
             )
 
-        tx_session_id = parts[0]
-        chunk_index_part = parts[1]
-        hex_payload_part = parts[2]
+        tx_session_id, chunk_index_part, hex_payload_part = message_text[
+            len(CHUNK_PREFIX) :
+        ].split(CHUNK_PARTS_DELIMITER)
 
         if not tx_session_id:
             raise InvalidChunkFormatError("tx_session_id is empty.")
@@ -130,6 +135,12 @@ class TransactionReassembler:
             raise InvalidChunkFormatError(
                 f"Invalid chunk numbering: {chunk_num}/{total_chunks}"
             )
+        # Sessions pre-allocate one slot per chunk, so bound total_chunks
+        # before a malformed or hostile header can force a huge allocation.
+        if total_chunks > MAX_TOTAL_CHUNKS:
+            raise InvalidChunkFormatError(
+                f"total_chunks {total_chunks} exceeds maximum of {MAX_TOTAL_CHUNKS}"
+            )
 
         return tx_session_id, chunk_num, total_chunks, hex_payload_part
 
@@ -187,8 +198,11 @@ class TransactionReassembler:
             server_logger.info(
                 f"{log_ctx} New reassembly session started. Expecting {total_chunks} chunks."
             )
+            # Chunks are stored in a list pre-sized to total_chunks (slot
+            # chunk_num - 1), so it never needs to grow as chunks arrive.
             sender_sessions[tx_session_id] = {
-                "chunks": {},
+                "chunks": [None] * total_chunks,
+                "received_count": 0,
                 "total_chunks": total_chunks,
                 "last_update_time": current_time,
                 "sender_id_str": str(sender_id),  # Store original sender_id for replies
@@ -207,7 +221,7 @@ class TransactionReassembler:
             raise MismatchedTotalChunksError(error_msg)
 
         # Check for duplicate chunk
-        if chunk_num in session_data["chunks"]:
+        if session_data["chunks"][chunk_num - 1] is not None:
             # Optional: could compare payloads to see if it's a true duplicate or retransmission of different data
             # For now, assume same chunk_num for same session_id is a duplicate to ignore or flag.
             # Story 2.1 Scenario: Duplicate chunk implies ignoring it.
@@ -218,30 +232,30 @@ class TransactionReassembler:
             # If strict error handling is needed for duplicates (e.g. NACK), raise here.
             return None  # Or raise DuplicateChunkError if caller should be aware
 
-        session_data["chunks"][chunk_num] = hex_payload_part
+        session_data["chunks"][chunk_num - 1] = hex_payload_part
+        session_data["received_count"] += 1
         session_data["last_update_time"] = current_time
         server_logger.debug(
             f"{log_ctx} Added chunk {chunk_num}/{total_chunks}. "
-            f"Collected {len(session_data['chunks'])} chunks."
+            f"Collected {session_data['received_count']} chunks."
         )
 
         # Check if all chunks are received
-        if len(session_data["chunks"]) == session_data["total_chunks"]:
+        if session_data["received_count"] == session_data["total_chunks"]:
             server_logger.info(
                 f"{log_ctx} All {total_chunks} chunks received. Attempting reassembly."
             )
             # Reassemble in correct order
-            reassembled_hex = ""
-            for i in range(1, total_chunks + 1):
-                if i not in session_data["chunks"]:
-                    # This should not happen if len matches total_chunks and all chunk_nums are valid
-                    # but as a safeguard:
+            chunks = session_data["chunks"]
+            for i, chunk in enumerate(chunks, start=1):
+                if chunk is None:
+                    # This should not happen if received_count matches total_chunks
+                    # and all chunk_nums are valid, but as a safeguard:
                     error_msg = f"{log_ctx} Reassembly failed: Missing chunk {i} despite expected completion."
                     server_logger.error(error_msg)
                     del sender_sessions[tx_session_id]  # Clean up inconsistent session
                     raise ReassemblyError(error_msg)  # Should be a specific error type
-
-                reassembled_hex += session_data["chunks"][i]
+            reassembled_hex = "".join(chunks)
 
             server_logger.info(f"{log_ctx} Reassembly successful.")
             # Clean up completed session
@@ -277,12 +291,11 @@ class TransactionReassembler:
                     current_time - session_data["last_update_time"]
                     > self.timeout_seconds
                 ):
-                    original_sender_id_str = session_data.get(
-                        "sender_id_str", str(session_key)  # Fallback
-                    )
+                    # Always populated when the session is created in add_chunk
+                    original_sender_id_str = session_data["sender_id_str"]
                     error_detail = (
                         f"Reassembly timeout after {self.timeout_seconds}s. "
-                        f"Received {len(session_data['chunks'])}/"
+                        f"Received {session_data['received_count']}/"
                         f"{session_data['total_chunks']} chunks."
                     )
                     server_logger.warning(
@@ -352,7 +365,7 @@ class TransactionReassembler:
                 sessions_info.append({
                     'session_id': tx_session_id,
                     'sender': session_data.get("sender_id_str", str(session_key)),
-                    'chunks_received': len(session_data.get("chunks", {})),
+                    'chunks_received': session_data.get("received_count", 0),
                     'total_chunks': session_data.get("total_chunks", 0),
                     'elapsed_seconds': elapsed,
                 })
@@ -1,8 +1,50 @@
 import requests
 import json
+import random
+import threading
 import time
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from core.logger_setup import server_logger  # Assuming a logger is available
+from core.transaction_parser import is_hex, quick_reject
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used without it
+    orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    """Serializes obj to compact JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(data: bytes):
+    """Parses JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Local Tor SOCKS proxy used for .onion RPC hosts. socks5h resolves the
+# hostname through Tor; needs the requests[socks] extra (PySocks).
+TOR_SOCKS_PROXY = 'socks5h://127.0.0.1:9050'
+
+# Connection pool shared by every BitcoinRPCClient's session, so a client
+# built to test settings and the server's own client (or one rebuilt after a
+# config change) reuse the same open TCP/Tor connection to the node. Auth is
+# sent per request, so sharing the pool across credentials is safe. urllib3
+# retries are disabled; rpc_request owns the retry policy.
+# The pool does not block: concurrent calls that find no idle connection
+# open another one (over Tor, a new circuit) rather than queueing - requests
+# passes no pool_timeout, so a blocking pool could wait forever once full.
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4, pool_maxsize=32, max_retries=Retry(total=0)
+)
+
 class BitcoinRPCClient:
     class BitcoinRPCException(Exception):
         def __init__(self, error_info):
@@ -16,7 +58,26 @@ class BitcoinRPCClient:
         def __repr__(self):
             return '<%s \'%s\'>' % (self.__class__.__name__, self)
 
-    def __init__(self, config: dict):
+    # Read-only methods whose results may be reused for a short time,
+    # mapped to their cache TTL in seconds.
+    _CACHEABLE = {"getblockchaininfo": 10.0}
+
+    # Methods that must not be resent after a connection error by default:
+    # bitcoind may already have accepted the broadcast.
+    _NOT_RETRYABLE = frozenset({"sendrawtransaction"})
+
+    # Fixed parts of the sendrawtransaction request; only the hex and fee
+    # rate are spliced in per broadcast.
+    _SENDRAWTX_PREFIX = b'{"jsonrpc":"1.0","id":"btcmesh","method":"sendrawtransaction","params":["'
+    _SENDRAWTX_SEPARATOR = b'",'
+    _SENDRAWTX_SUFFIX = b']}'
+
+    def __init__(self, config: dict, eager_probe: bool = False):
+        """
+        Prepares a client for the node described by config. No network
+        traffic happens here unless eager_probe is True; call connect() to
+        verify the node is reachable and learn its chain.
+        """
         user = config['user']
         password = config['password']
 
@@ -28,9 +89,36 @@ class BitcoinRPCClient:
         if port is None:
             raise ValueError("'port' cannot be None")
         
-        self.uri = f"http://{user}:{password}@{host}:{port}"
+        # Credentials live on the session (HTTP basic auth) rather than in
+        # the URL, so passwords containing ':' or '@' don't break parsing.
+        self.rpc_url = f"http://{host}:{port}"
         self.use_tor = host.endswith(".onion")
-        self.connect()  # Establish connection on initialization
+
+        # One persistent session per client: keeps the TCP (and, over Tor,
+        # SOCKS) connection alive between calls instead of re-handshaking.
+        self._session = requests.Session()
+        self._session.auth = (user, password)
+        self._session.headers.update({'Content-Type': 'application/json', 'Connection': 'keep-alive'})
+        self._session.mount('http://', _HTTP_ADAPTER)
+        if self.use_tor:
+            # Set once so the pooled SOCKS tunnel is reused across calls.
+            # requests lets http_proxy/https_proxy from the environment
+            # override Session.proxies, which would send .onion traffic (and
+            # the RPC credentials) to a clearnet proxy - so ignore the
+            # environment entirely for Tor clients.
+            self._session.trust_env = False
+            self._session.proxies = {'http': TOR_SOCKS_PROXY, 'https': TOR_SOCKS_PROXY}
+
+        # {(method, params_tuple): (monotonic_timestamp, result)} for _CACHEABLE methods
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+        self.chain = None  # Set by connect()
+
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread = None
+        if eager_probe:
+            self.connect()
 
     def connect(self):
         """Connects to Bitcoin Core RPC using the provided config dictionary."""
@@ -39,77 +127,211 @@ class BitcoinRPCClient:
         # Test connection and get chain info
         info = self.getblockchaininfo()
         self.chain = info['chain']  # Store chain for later access (main, test, testnet4, signet)
-        server_logger.debug(f"Connected to Bitcoin Core chain: {self.chain}")
+        server_logger.debug("Connected to Bitcoin Core chain: %s", self.chain)
 
-    def rpc_request(self, method, params=None, retries: int = 3, delay: int = 5):
-        """Performs a JSON-RPC requests with automatic connection retry logic."""
-        if self.use_tor:
-            proxies = {
-                'http': 'socks5h://127.0.0.1:9050',
-                'https': 'socks5h://127.0.0.1:9050'
-            }
-        else:
-            proxies = {}
+    def _post(self, body: bytes):
+        """POSTs an encoded JSON-RPC request (single call or batch) over the session."""
+        return self._session.post(self.rpc_url, data=body, timeout=30)
+
+    def rpc_request(self, method, params=None, retries: int = None,
+                    backoff_base: float = 0.5, backoff_cap: float = 30.0,
+                    body: bytes = None):
+        """Performs a JSON-RPC requests with automatic connection retry logic.
 
+        retries defaults to 3 attempts, or 1 for methods in _NOT_RETRYABLE;
+        an explicit value is always honoured. The wait before retry i is
+        min(backoff_cap, backoff_base * 2**i), jittered down to 50-100% so
+        clients recovering from the same outage don't retry in lockstep.
+
+        If body is given it must be the already-encoded request for method
+        and is sent as-is instead of encoding params.
+        """
+        if retries is None:
+            retries = 1 if method in self._NOT_RETRYABLE else 3
         if params is None:
             params = []
-        
-        headers = {'Content-Type': 'application/json'}
-        payload = {
-            "jsonrpc": "1.0",
-            "id": "btcmesh",
-            "method": method,
-            "params": params
-        }
+
+        ttl = self._CACHEABLE.get(method)
+        if ttl is not None:
+            cache_key = (method, tuple(params))
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                server_logger.debug("Using cached result for RPC method: %s", method)
+                return cached[1]
+
+        if body is None:
+            body = _json_dumps({
+                "jsonrpc": "1.0",
+                "id": "btcmesh",
+                "method": method,
+                "params": params
+            })
 
         for i in range(retries):
             try:
-                server_logger.debug(f"Executing RPC method: {method} (Attempt {i + 1}/{retries})")
-                response = requests.post(self.uri, data=json.dumps(payload), headers=headers, proxies=proxies, timeout=30)
+                server_logger.debug("Executing RPC method: %s (Attempt %d/%d)", method, i + 1, retries)
+                response = self._post(body)
                 # response.raise_for_status()  # Raise an HTTPError for bad responses
-                result = response.json()
+                result = _json_loads(response.content)
                 if result.get("error"):
                     raise self.BitcoinRPCException(result["error"])
+                if ttl is not None:
+                    with self._cache_lock:
+                        self._cache[cache_key] = (time.monotonic(), result["result"])
                 return result["result"]
-            except (ConnectionError, TimeoutError) as e:
-                server_logger.debug(f"Connection error detected: {e}")
+            except (ConnectionError, TimeoutError,
+                    requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                server_logger.debug("Connection error detected: %s", e)
                 if i < retries - 1:
-                    server_logger.debug(f"Retrying connection in {delay} seconds...")
+                    delay = min(backoff_cap, backoff_base * 2 ** i) * (0.5 + random.random() * 0.5)
+                    server_logger.debug("Retrying connection in %.2f seconds...", delay)
                     time.sleep(delay)
                 else:
                     server_logger.debug("Max retries reached. Failing...")
                     raise  # Re-raise the exception after exhausting retries
             except Exception as e:
                 # Log any other exceptions and re-raise
-                server_logger.debug(f"Other error detected: {e}")
+                server_logger.debug("Other error detected: %s", e)
                 raise  # Re-raise any unexpected exception        
 
-    def getblockchaininfo(self):
+    def batch_call(self, calls):
+        """
+        Sends several JSON-RPC calls in a single HTTP request (JSON-RPC batch).
+
+        Args:
+            calls: List of (method, params) tuples; params may be None.
+
+        Returns:
+            List of results, in the same order as calls.
+
+        Raises:
+            BitcoinRPCException: If any call in the batch returned an error,
+                or the reply is not one result per call.
+        """
+        if not calls:
+            return []
+        payload = [
+            {"jsonrpc": "1.0", "id": i, "method": method, "params": params or []}
+            for i, (method, params) in enumerate(calls)
+        ]
+        server_logger.debug("Executing RPC batch of %d calls", len(payload))
+        response = self._post(_json_dumps(payload))
+        replies = _json_loads(response.content)
+        if not isinstance(replies, list):
+            # A node that rejects the batch as a whole answers with one
+            # plain error object instead of a list
+            error = replies.get("error") if isinstance(replies, dict) else None
+            raise self.BitcoinRPCException(
+                error or {"code": -32603, "message": "Batch reply is not a list"}
+            )
+        # bitcoind may answer batch elements in any order - match them back by id
+        by_id = {reply.get("id"): reply for reply in replies}
+        if len(replies) != len(calls) or set(by_id) != set(range(len(calls))):
+            raise self.BitcoinRPCException({
+                "code": -32603,
+                "message": "Batch reply ids %s do not match the %d calls sent"
+                % (sorted(by_id, key=str), len(calls)),
+            })
+        replies = [by_id[i] for i in range(len(calls))]
+        for reply in replies:
+            if reply.get("error"):
+                raise self.BitcoinRPCException(reply["error"])
+        return [reply["result"] for reply in replies]
+
+    def start_keepalive(self, interval: float = 30.0):
+        """
+        Starts a daemon thread that calls getblockchaininfo every interval
+        seconds until close(), keeping the pooled connection (and, over
+        Tor, its circuit) open so a real broadcast doesn't pay to rebuild
+        it. Calling it again while running is a no-op.
+        """
+        if self._keepalive_thread is not None:
+            return
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, args=(interval,),
+            name="rpc-keepalive", daemon=True,
+        )
+        self._keepalive_thread.start()
+
+    def _keepalive_loop(self, interval: float):
+        while not self._keepalive_stop.wait(interval):
+            try:
+                self.getblockchaininfo()
+            except Exception as e:
+                server_logger.debug("RPC keepalive failed: %s", e)
+
+    def invalidate_cache(self):
+        """Discards all cached read-only RPC results."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self):
+        """Closes the underlying HTTP session.
+
+        The shared _HTTP_ADAPTER is detached first rather than closed, since
+        closing it would drop the pooled connections other clients still use.
+        """
+        self._keepalive_stop.set()
+        self._session.adapters.pop('http://', None)
+        self._session.close()
+
+    def getblockchaininfo(self, fresh: bool = False):
+        """
+        Returns getblockchaininfo, reusing the result from connect() or an
+        earlier call if it is within its _CACHEABLE TTL, unless fresh is True.
+        """
+        if fresh:
+            with self._cache_lock:
+                self._cache.pop(("getblockchaininfo", ()), None)
         return self.rpc_request("getblockchaininfo")
         
     def sendrawtransaction(self, raw_tx_hex, max_fee_rate=0.0):
         # Bitcoin Core RPC sendrawtransaction takes an optional maxfeerate.
         # Setting to 0.0 means no limit.
-        return self.rpc_request("sendrawtransaction", [raw_tx_hex, max_fee_rate])
+        # A broadcast changes mempool/chain state, so drop any cached reads.
+        self.invalidate_cache()
+        if not is_hex(raw_tx_hex):
+            # Let the node report the error; encode normally so it's escaped
+            return self.rpc_request("sendrawtransaction", [raw_tx_hex, max_fee_rate])
+        # Hex needs no JSON escaping, so splice it straight into the request
+        # instead of having the encoder scan and copy a multi-kB string.
+        body = b''.join((
+            self._SENDRAWTX_PREFIX,
+            raw_tx_hex.encode('ascii'),
+            self._SENDRAWTX_SEPARATOR,
+            _json_dumps(max_fee_rate),
+            self._SENDRAWTX_SUFFIX,
+        ))
+        return self.rpc_request("sendrawtransaction", body=body)
     
     def broadcast_transaction(self, raw_tx_hex: str):
         """
         Broadcasts a raw transaction hex via Bitcoin Core RPC sendrawtransaction.
         Returns (txid, None) on success or (None, error_message) on failure.
         """
-        server_logger.debug(f"Calling broadcast_transaction_via_rpc: raw_tx_hex: {raw_tx_hex}")
-        
+        # Lazy %-style args throughout: raw_tx_hex can be many kB, and is only
+        # formatted into a message if DEBUG logging is actually enabled.
+        server_logger.debug("Calling broadcast_transaction_via_rpc: raw_tx_hex: %s", raw_tx_hex)
+
         try:
+            # Don't spend an RPC round trip (a full Tor RTT for .onion nodes)
+            # on hex the node would obviously reject.
+            rejection = quick_reject(raw_tx_hex)
+            if rejection:
+                server_logger.debug("Rejected before broadcast: %s", rejection)
+                return None, rejection
+
             txid = self.sendrawtransaction(raw_tx_hex, 0.0)  # Pass 0.0 for no fee rate limit
-            server_logger.debug(f"Transaction ID received: {txid}")
+            server_logger.debug("Transaction ID received: %s", txid)
             return txid, None
         except self.BitcoinRPCException as e:
             message = e.message
-            server_logger.debug(f"Caught an RPC error with code {e.code}: {e.message}")
+            server_logger.debug("Caught an RPC error with code %s: %s", e.code, e.message)
             return None, message
         except requests.exceptions.RequestException as e:
-            server_logger.debug(f"RequestException: {str(e)}")
+            server_logger.debug("RequestException: %s", e)
             return None, str(e)
         except Exception as e:
-            server_logger.debug(f"General Exception: {str(e)}")
+            server_logger.debug("General Exception: %s", e)
             return None, str(e)
@@ -15,14 +15,16 @@ from typing import Any, Dict, List, Optional
 
 
 # Default path relative to project root
-DEFAULT_HISTORY_FILE = "data/transaction_history.json"
+DEFAULT_HISTORY_FILE = "data/transaction_history.jsonl"
 
 
 class TransactionHistory:
     """Manages persistent transaction history storage.
 
-    Stores completed transactions (success and failure) in a JSON file.
-    Thread-safe for concurrent access.
+    Stores completed transactions (success and failure) in a JSON Lines file,
+    one entry per line, oldest first. The file is read once on construction
+    and kept in memory; each add() appends a single line rather than
+    rewriting the whole file. Thread-safe for concurrent access.
 
     Example:
         history = TransactionHistory()
@@ -36,53 +38,112 @@ class TransactionHistory:
         entries = history.get_all()
     """
 
-    def __init__(self, filepath: str = DEFAULT_HISTORY_FILE):
+    def __init__(self, filepath: str = DEFAULT_HISTORY_FILE, fsync: bool = False):
         """Initialize TransactionHistory.
 
         Args:
-            filepath: Path to the JSON history file. Defaults to data/transaction_history.json.
-                      Parent directory will be created if it doesn't exist.
+            filepath: Path to the JSONL history file. Defaults to data/transaction_history.jsonl.
+                      Parent directory will be created if it doesn't exist. If the
+                      file is missing but a legacy .json history sits next to it (or
+                      the file itself is in the legacy format), it is migrated.
+            fsync: Whether to fsync after every write. Off by default - writes
+                   are already crash-safe against partial rewrites (see _rewrite);
+                   this additionally guards against losing the last entries on
+                   power loss, at the cost of a disk sync per add().
         """
         self._filepath = Path(filepath)
+        self._fsync = fsync
         self._lock = threading.Lock()
+        # Newest first, mirroring get_all()
+        self._entries: List[Dict[str, Any]] = []
         self._ensure_file_exists()
+        self._entries = self._load_entries()
 
     def _ensure_file_exists(self) -> None:
         """Create the data directory and history file if they don't exist."""
         # Create parent directory if needed
         self._filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create empty history file if it doesn't exist
-        if not self._filepath.exists():
-            self._save_data({"version": 1, "transactions": []})
+        if self._filepath.exists():
+            return
 
-    def _load_data(self) -> Dict[str, Any]:
-        """Load history data from file.
+        legacy_path = self._filepath.with_suffix(".json")
+        if legacy_path != self._filepath and legacy_path.exists():
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                legacy_entries = self._legacy_transactions(f.read())
+            if legacy_entries is not None:
+                self._rewrite(legacy_entries)
+                return
+
+        # Create empty history file
+        self._filepath.touch()
+
+    @staticmethod
+    def _legacy_transactions(content: str) -> Optional[List[Dict[str, Any]]]:
+        """Extract entries from legacy {"version": 1, "transactions": [...]} content.
 
         Returns:
-            Dict with 'version' and 'transactions' keys.
+            The transactions (newest first), or None if content isn't in
+            the legacy format.
         """
         try:
-            with open(self._filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure required structure
-                if "transactions" not in data:
-                    data["transactions"] = []
-                if "version" not in data:
-                    data["version"] = 1
-                return data
-        except (json.JSONDecodeError, FileNotFoundError):
-            # Return empty structure on error
-            return {"version": 1, "transactions": []}
-
-    def _save_data(self, data: Dict[str, Any]) -> None:
-        """Save history data to file.
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            # Includes any JSONL file with more than one line
+            return None
+        if not isinstance(data, dict) or not ("transactions" in data or "version" in data):
+            return None
+        return data.get("transactions", [])
+
+    def _load_entries(self) -> List[Dict[str, Any]]:
+        """Load all entries from the history file.
+
+        Lines that fail to parse (e.g. a partial line left by a crash) are
+        skipped; add() starts a fresh line after such a fragment. A file
+        still in the legacy single-document format is migrated to JSONL
+        in place.
 
-        Args:
-            data: Dict with 'version' and 'transactions' keys.
+        Returns:
+            List of transaction entries, newest first.
+        """
+        try:
+            with open(self._filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return []
+
+        legacy_entries = self._legacy_transactions(content)
+        if legacy_entries is not None:
+            self._rewrite(legacy_entries)
+            return list(legacy_entries)
+
+        entries = []
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+        entries.reverse()
+        return entries
+
+    def _rewrite(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the history file contents with entries (given newest first).
+
+        Writes to a temporary file and atomically swaps it in with
+        os.replace, so a crash mid-write leaves the old history intact.
         """
-        with open(self._filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp_path = self._filepath.with_name(self._filepath.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in reversed(entries):
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if self._fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self._filepath)
 
     def add(
         self,
@@ -112,12 +173,24 @@ class TransactionHistory:
             "error": error,
             "raw_tx": raw_tx
         }
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8')
 
         with self._lock:
-            data = self._load_data()
+            with open(self._filepath, 'ab+') as f:
+                # A torn last write (crash mid-append) leaves no trailing
+                # newline - don't glue this entry onto the fragment. Checked
+                # here rather than repaired on load, since another instance
+                # (e.g. the GUI's history popup) may load at any time.
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+                if self._fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
             # Insert at beginning (newest first)
-            data["transactions"].insert(0, entry)
-            self._save_data(data)
+            self._entries.insert(0, entry)
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all transaction entries.
@@ -126,8 +199,19 @@ class TransactionHistory:
             List of transaction entries, newest first.
         """
         with self._lock:
-            data = self._load_data()
-            return data.get("transactions", [])
+            return list(self._entries)
+
+    def get_recent(self, n: int) -> List[Dict[str, Any]]:
+        """Get the n most recent transaction entries.
+
+        Args:
+            n: Maximum number of entries to return.
+
+        Returns:
+            Up to n transaction entries, newest first.
+        """
+        with self._lock:
+            return self._entries[:max(n, 0)]
 
     def clear(self) -> None:
         """Clear all transaction history.
@@ -135,7 +219,8 @@ class TransactionHistory:
         Primarily useful for testing.
         """
         with self._lock:
-            self._save_data({"version": 1, "transactions": []})
+            self._rewrite([])
+            self._entries = []
 
     @property
     def filepath(self) -> Path:
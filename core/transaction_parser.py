@@ -2,8 +2,22 @@
 Bitcoin raw transaction parser for btcmesh relay.
 """
 
+import struct
 from typing import Dict, Any, Optional
 
+# Little-endian fixed-width readers, built once. unpack_from reads in place,
+# so no slice of the transaction buffer is allocated per field.
+_U16 = struct.Struct("<H").unpack_from
+_U32 = struct.Struct("<I").unpack_from
+_U64 = struct.Struct("<Q").unpack_from
+
+# Smallest possible serialized transaction: version (4) + input count (1) +
+# one input with empty scriptSig (41) + output count (1) + one output with
+# empty scriptPubKey (9) + locktime (4) = 60 bytes.
+MIN_TX_HEX_LEN = 60 * 2
+
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
 # Helper for varint parsing
 
 
@@ -12,11 +26,11 @@ def read_varint(data: bytes, offset: int) -> (int, int):
     if fb < 0xFD:
         return fb, offset + 1
     elif fb == 0xFD:
-        return int.from_bytes(data[offset + 1 : offset + 3], "little"), offset + 3
+        return _U16(data, offset + 1)[0], offset + 3
     elif fb == 0xFE:
-        return int.from_bytes(data[offset + 1 : offset + 5], "little"), offset + 5
+        return _U32(data, offset + 1)[0], offset + 5
     elif fb == 0xFF:
-        return int.from_bytes(data[offset + 1 : offset + 9], "little"), offset + 9
+        return _U64(data, offset + 1)[0], offset + 9
     return (
         0,
         0,
@@ -37,7 +51,7 @@ def decode_raw_transaction_hex(hex_str: str) -> Dict[str, Any]:
         is_segwit = False
 
         # Version (4 bytes, little-endian)
-        version = int.from_bytes(data[offset : offset + 4], "little")
+        version = _U32(data, offset)[0]
         offset += 4
 
         # Check for SegWit marker and flag
@@ -55,16 +69,18 @@ def decode_raw_transaction_hex(hex_str: str) -> Dict[str, Any]:
 
         # Skip all inputs
         for _ in range(input_count):
-            # Previous Transaction Hash (32 bytes)
-            offset += 32
-            # Previous Output Index (4 bytes)
-            offset += 4
-            # ScriptSig Size (VarInt)
-            scriptsig_len, offset = read_varint(data, offset)
-            # ScriptSig (variable length)
-            offset += scriptsig_len
-            # Sequence Number (4 bytes)
-            offset += 4
+            # Previous Transaction Hash (32 bytes) + Previous Output Index (4 bytes)
+            offset += 36
+            # ScriptSig Size (VarInt). Almost always a single byte (and 0 for
+            # SegWit inputs), so handle that inline and only call
+            # read_varint for the multi-byte forms.
+            scriptsig_len = data[offset]
+            if scriptsig_len < 0xFD:
+                offset += 1
+            else:
+                scriptsig_len, offset = read_varint(data, offset)
+            # ScriptSig (variable length) + Sequence Number (4 bytes)
+            offset += scriptsig_len + 4
 
         # Output count (varint)
         output_count, offset = read_varint(data, offset)
@@ -77,7 +93,7 @@ def decode_raw_transaction_hex(hex_str: str) -> Dict[str, Any]:
         # we will assume locktime is at the end for now. A full parser would handle witness data.
         # This might be inaccurate if there's witness data.
         # However, for the specific error "No inputs" or "No outputs", this simplified locktime parsing is not the cause.
-        locktime = int.from_bytes(data[-4:], "little")
+        locktime = _U32(data, len(data) - 4)[0]
 
         return {
             "version": version,
@@ -94,6 +110,33 @@ def decode_raw_transaction_hex(hex_str: str) -> Dict[str, Any]:
         raise ValueError(f"Failed to decode raw transaction: {e}")
 
 
+def is_hex(hex_str: str) -> bool:
+    """Returns True if hex_str consists only of hex digits."""
+    # Deleting every hex digit (a C-level pass) must leave nothing behind
+    return hex_str.isascii() and not hex_str.encode("ascii").translate(None, _HEX_DIGITS)
+
+
+def quick_reject(hex_str: str) -> Optional[str]:
+    """
+    Cheaply rejects obviously invalid raw transaction hex without decoding it.
+    Only the first few header bytes are hex-decoded, so garbage or truncated
+    payloads are turned away before a full bytes.fromhex of the whole string.
+    Returns an error message if the hex is clearly invalid, otherwise None
+    (which does not mean the transaction is valid).
+    """
+    if len(hex_str) < MIN_TX_HEX_LEN:
+        return "Transaction too short"
+    if len(hex_str) % 2 or not is_hex(hex_str):
+        return "Invalid hex"
+
+    # Version (4) + optional SegWit marker/flag (2) + first input-count byte
+    header = bytes.fromhex(hex_str[:14])
+    offset = 6 if header[4] == 0x00 and header[5] == 0x01 else 4
+    if header[offset] == 0:
+        return "No inputs"
+    return None
+
+
 def basic_sanity_check(tx: dict) -> (bool, Optional[str]):
     """
     Performs basic sanity checks on a decoded Bitcoin transaction dict.
@@ -1,5 +1,6 @@
 import sys
 import os
+import socket
 
 # Adjust the path to include the project root if
 # test_bitcoin_connection.py is in the root
@@ -8,7 +9,7 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 try:
     from core.config_loader import load_app_config, load_bitcoin_rpc_config
-    from core.rpc_client import BitcoinRPCClient
+    from core.rpc_client import BitcoinRPCClient, TOR_SOCKS_PROXY
 
     # # Import Tor management functions and SOCKS port from btcmesh_server
     # from btcmesh_server import TOR_SOCKS_PORT, start_tor, stop_tor
@@ -20,6 +21,16 @@ except ImportError as e:
     )
     sys.exit(1)
 
+def tor_socks_reachable(timeout=0.5):
+    """Returns True if something is listening on the Tor SOCKS proxy port."""
+    host, port = TOR_SOCKS_PROXY.rsplit("/", 1)[1].split(":")
+    try:
+        with socket.create_connection((host, int(port)), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 # Example raw transaction hex provided by the user
 EXAMPLE_RAW_TX = (
     "0200000000010159b52f5572ff75df2b0dfad1fc9a1eae87dd5d0750ba59133a959b934c3b14500100000000fdffffff0200000000000000003d6a3b6261666b726569656a35687178786e326474677663356a66796574616661716472667a34746a7068626177616665786e7a776c746f6a347a366b34a01e0f0000000000160014214f6d2205bf13114220eefaf1721c1b1715453f02473044022038ee60a21dd309cd67445cad011ddad298ddab3171ee44be6fbb10f1d63d4fcd02207d4fa4cb95a91ac601a0d77c56478c4a95faf395835d27755fa0255ccd22e0bd0121027e47a3a758f2d90b2f824cd90d58183711d00b464aa15c821e6613b97e7117c4afa70d00"
@@ -58,17 +69,23 @@ def main():
         )
         sys.exit(1)
 
-    # Check for .onion address and start Tor if needed
+    # Check for .onion address and make sure Tor is running if needed
     if rpc_config["host"].endswith(".onion"):
         print(
             f"Detected .onion address ({rpc_config['host']}). "
-            "Attempting to start Tor..."
+            "Checking the local Tor SOCKS proxy..."
         )
+        # Fail fast here rather than waiting out the RPC timeout in Step 3
+        if not tor_socks_reachable():
+            print(f"Tor SOCKS proxy not reachable at {TOR_SOCKS_PROXY}.")
+            print("Please start Tor before connecting to a .onion node.")
+            sys.exit(1)
 
         print("\nStep 3: Attempting to connect to Bitcoin Core RPC node...")
         rpc = None
         try:
             rpc = BitcoinRPCClient(rpc_config)
+            rpc.connect()
             print("Successfully initiated connection object.")
         except Exception as e:
             print(
@@ -86,18 +103,23 @@ def main():
 
         print("\nStep 4: Calling getblockchaininfo()...")
         try:
+            # Served from the result connect() just fetched - no second
+            # round trip (a full Tor RTT for .onion nodes).
             blockchain_info = rpc.getblockchaininfo()
-            print("Successfully called getblockchaininfo(). Response:")
-            print(f"  Chain: {blockchain_info.get('chain')}")
-            print(f"  Blocks: {blockchain_info.get('blocks')}")
-            print(f"  Headers: {blockchain_info.get('headers')}")
-            print(
-                f"  Verification Progress: "
-                f"{blockchain_info.get('verificationprogress')}"
+            chain, blocks, headers, progress, ibd = (
+                blockchain_info.get(key)
+                for key in (
+                    "chain", "blocks", "headers",
+                    "verificationprogress", "initialblockdownload",
+                )
             )
             print(
-                f"  Initial Block Download: "
-                f"{blockchain_info.get('initialblockdownload')}"
+                "Successfully called getblockchaininfo(). Response:\n"
+                f"  Chain: {chain}\n"
+                f"  Blocks: {blocks}\n"
+                f"  Headers: {headers}\n"
+                f"  Verification Progress: {progress}\n"
+                f"  Initial Block Download: {ibd}"
             )
             print("\nBasic connection test successful!")
         except Exception as e:
@@ -5,13 +5,28 @@ preview output, device connection/port resolution, and exit codes. Business
 logic (chunking, ARQ, retries, ACK/NACK handling) is tested in
 tests/test_client_sender.py and tests/test_meshtastic_serial_transport.py.
 """
+import io
+import re
 import unittest
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from unittest.mock import patch, MagicMock
 
+from core.constants import DEFAULT_CHUNK_SIZE
 from transport.base import TransportConnectionError
 from client.sender import SendResult
 import btcmesh_client_cli as cli
 
+# BTC_TX|<session_id>|<chunk_num>/<total_chunks>|<payload>
+_BTC_TX_LINE_RE = re.compile(r"^BTC_TX\|([^|]+)\|(\d+)/(\d+)\|(.*)$")
+
+
+@contextmanager
+def _captured_output():
+    """Captures stdout and stderr, yielding their (out, err) StringIO buffers."""
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        yield out, err
+
 
 class TestParseArgs(unittest.TestCase):
     """Tests for parse_args()."""
@@ -30,35 +45,35 @@ class TestParseArgs(unittest.TestCase):
         self.assertTrue(args.dry_run)
         self.assertEqual(args.port, "/dev/ttyUSB0")
 
-    def test_missing_destination_raises_system_exit(self):
-        with self.assertRaises(SystemExit):
-            cli.parse_args(["-tx", "deadbeef"])
-
-    def test_missing_tx_raises_system_exit(self):
-        with self.assertRaises(SystemExit):
-            cli.parse_args(["-d", "!abcdef12"])
+    def test_missing_required_arg_raises_system_exit(self):
+        cases = [
+            ("destination", ["-tx", "deadbeef"]),
+            ("tx", ["-d", "!abcdef12"]),
+        ]
+        for missing, argv in cases:
+            with self.subTest(missing=missing):
+                with self.assertRaises(SystemExit):
+                    cli.parse_args(argv)
 
 
 class TestCliMainValidation(unittest.TestCase):
     """Tests for cli_main()'s hex validation path."""
 
-    def test_invalid_hex_prints_error_and_returns_1(self):
-        with patch("builtins.print") as mock_print:
-            code = cli.cli_main(["-d", "!abcdef12", "-tx", "zz"])
-        self.assertEqual(code, 1)
-        printed = "\n".join(str(c.args[0]) for c in mock_print.call_args_list)
-        self.assertIn("Invalid raw transaction hex", printed)
-
-    def test_odd_length_hex_prints_error_and_returns_1(self):
-        with patch("builtins.print") as mock_print:
-            code = cli.cli_main(["-d", "!abcdef12", "-tx", "abc"])
-        self.assertEqual(code, 1)
-        printed = "\n".join(str(c.args[0]) for c in mock_print.call_args_list)
-        self.assertIn("Invalid raw transaction hex", printed)
+    def test_bad_hex_prints_error_and_returns_1(self):
+        cases = [
+            ("non_hex", "zz"),
+            ("odd_length", "abc"),
+        ]
+        for name, tx_hex in cases:
+            with self.subTest(name=name):
+                with _captured_output() as (_, err):
+                    code = cli.cli_main(["-d", "!abcdef12", "-tx", tx_hex])
+                self.assertEqual(code, 1)
+                self.assertIn("Invalid raw transaction hex", err.getvalue())
 
     def test_invalid_hex_does_not_attempt_connection(self):
-        with patch("btcmesh_client_cli.MeshtasticSerialTransport") as mock_transport_cls, \
-             patch("builtins.print"):
+        with patch("btcmesh_client_cli.MeshtasticSerialTransport", autospec=True) as mock_transport_cls, \
+             _captured_output():
             cli.cli_main(["-d", "!abcdef12", "-tx", "zz"])
         mock_transport_cls.assert_not_called()
 
@@ -66,22 +81,40 @@ class TestCliMainValidation(unittest.TestCase):
 class TestCliMainDryRun(unittest.TestCase):
     """Tests for cli_main() --dry-run path (run_preview)."""
 
+    # (tx hex length, expected chunk count) around DEFAULT_CHUNK_SIZE=170
+    CHUNKING_CASES = [
+        (8, 1),
+        (170, 1),
+        (172, 2),
+        (340, 2),
+        (450, 3),
+        (510, 3),
+    ]
+
     def test_dry_run_prints_chunk_preview(self):
-        tx_hex = "a" * 450  # 3 chunks at DEFAULT_CHUNK_SIZE=170
-        with patch("builtins.print") as mock_print:
-            code = cli.cli_main(["-d", "!abcdef12", "-tx", tx_hex, "--dry-run"])
-        self.assertEqual(code, 0)
-        printed_lines = [
-            str(c.args[0]) for c in mock_print.call_args_list
-            if str(c.args[0]).startswith("BTC_TX|")
-        ]
-        self.assertEqual(len(printed_lines), 3)
-        for i, line in enumerate(printed_lines, 1):
-            self.assertIn(f"|{i}/3|", line)
+        for length, expected_total in self.CHUNKING_CASES:
+            with self.subTest(length=length):
+                tx_hex = ("0123456789abcdef" * 32)[:length]
+                expected_chunks = [
+                    tx_hex[i:i + DEFAULT_CHUNK_SIZE]
+                    for i in range(0, len(tx_hex), DEFAULT_CHUNK_SIZE)
+                ]
+                with _captured_output() as (out, _):
+                    code = cli.cli_main(["-d", "!abcdef12", "-tx", tx_hex, "--dry-run"])
+                self.assertEqual(code, 0)
+                parsed = [
+                    m.groups() for line in out.getvalue().splitlines()
+                    if (m := _BTC_TX_LINE_RE.match(line))
+                ]
+                self.assertEqual(len(parsed), expected_total)
+                self.assertEqual(len({session_id for session_id, _, _, _ in parsed}), 1)
+                for i, (_, chunk_num, total, _) in enumerate(parsed, 1):
+                    self.assertEqual((chunk_num, total), (str(i), str(expected_total)))
+                self.assertEqual([payload for _, _, _, payload in parsed], expected_chunks)
 
     def test_dry_run_does_not_connect_to_device(self):
-        with patch("btcmesh_client_cli.MeshtasticSerialTransport") as mock_transport_cls, \
-             patch("builtins.print"):
+        with patch("btcmesh_client_cli.MeshtasticSerialTransport", autospec=True) as mock_transport_cls, \
+             _captured_output():
             code = cli.cli_main(["-d", "!abcdef12", "-tx", "deadbeef", "--dry-run"])
         self.assertEqual(code, 0)
         mock_transport_cls.assert_not_called()
@@ -91,24 +124,23 @@ class TestRunSendConnection(unittest.TestCase):
     """Tests for run_send()'s device connection / port resolution."""
 
     def test_connection_failure_prints_error_and_returns_2(self):
-        with patch("btcmesh_client_cli.MeshtasticSerialTransport") as mock_transport_cls, \
-             patch("btcmesh_client_cli.TransactionSender") as mock_sender_cls, \
-             patch("builtins.print") as mock_print:
+        with patch("btcmesh_client_cli.MeshtasticSerialTransport", autospec=True) as mock_transport_cls, \
+             patch("btcmesh_client_cli.TransactionSender", autospec=True) as mock_sender_cls, \
+             _captured_output() as (_, err):
             mock_transport = mock_transport_cls.return_value
             mock_transport.connect.side_effect = TransportConnectionError("no device found")
 
             code = cli.run_send("!abcdef12", "deadbeef")
 
         self.assertEqual(code, 2)
-        printed = "\n".join(str(c.args[0]) for c in mock_print.call_args_list)
-        self.assertIn("Failed to connect", printed)
+        self.assertIn("Failed to connect", err.getvalue())
         mock_sender_cls.assert_not_called()
 
     def test_explicit_port_overrides_env(self):
-        with patch("btcmesh_client_cli.MeshtasticSerialTransport") as mock_transport_cls, \
-             patch("btcmesh_client_cli.TransactionSender") as mock_sender_cls, \
+        with patch("btcmesh_client_cli.MeshtasticSerialTransport", autospec=True) as mock_transport_cls, \
+             patch("btcmesh_client_cli.TransactionSender", autospec=True) as mock_sender_cls, \
              patch("btcmesh_client_cli.get_meshtastic_serial_port", return_value="/dev/env_port"), \
-             patch("builtins.print"):
+             _captured_output():
             mock_transport = mock_transport_cls.return_value
             mock_sender = mock_sender_cls.return_value
             mock_sender.send_transaction.return_value = SendResult(
@@ -120,10 +152,10 @@ class TestRunSendConnection(unittest.TestCase):
         mock_transport.connect.assert_called_once_with("/dev/explicit_port")
 
     def test_omitted_port_falls_back_to_env(self):
-        with patch("btcmesh_client_cli.MeshtasticSerialTransport") as mock_transport_cls, \
-             patch("btcmesh_client_cli.TransactionSender") as mock_sender_cls, \
+        with patch("btcmesh_client_cli.MeshtasticSerialTransport", autospec=True) as mock_transport_cls, \
+             patch("btcmesh_client_cli.TransactionSender", autospec=True) as mock_sender_cls, \
              patch("btcmesh_client_cli.get_meshtastic_serial_port", return_value="/dev/env_port"), \
-             patch("builtins.print"):
+             _captured_output():
             mock_transport = mock_transport_cls.return_value
             mock_sender = mock_sender_cls.return_value
             mock_sender.send_transaction.return_value = SendResult(
@@ -139,8 +171,8 @@ class TestRunSendResult(unittest.TestCase):
     """Tests for run_send()'s handling of the SendResult from TransactionSender."""
 
     def _patch_transport_and_sender(self, send_result=None, send_side_effect=None):
-        transport_patch = patch("btcmesh_client_cli.MeshtasticSerialTransport")
-        sender_patch = patch("btcmesh_client_cli.TransactionSender")
+        transport_patch = patch("btcmesh_client_cli.MeshtasticSerialTransport", autospec=True)
+        sender_patch = patch("btcmesh_client_cli.TransactionSender", autospec=True)
         mock_transport_cls = transport_patch.start()
         mock_sender_cls = sender_patch.start()
         self.addCleanup(transport_patch.stop)
@@ -158,31 +190,29 @@ class TestRunSendResult(unittest.TestCase):
         mock_transport, _ = self._patch_transport_and_sender(
             send_result=SendResult(success=True, session_id="abc12", txid="txid123")
         )
-        with patch("builtins.print") as mock_print:
+        with _captured_output() as (out, _):
             code = cli.run_send("!abcdef12", "deadbeef")
 
         self.assertEqual(code, 0)
-        printed = "\n".join(str(c.args[0]) for c in mock_print.call_args_list)
-        self.assertIn("txid123", printed)
+        self.assertIn("txid123", out.getvalue())
         mock_transport.disconnect.assert_called_once()
 
     def test_failed_send_prints_error_and_returns_1(self):
         mock_transport, _ = self._patch_transport_and_sender(
             send_result=SendResult(success=False, session_id="abc12", error="Insufficient fee")
         )
-        with patch("builtins.print") as mock_print:
+        with _captured_output() as (_, err):
             code = cli.run_send("!abcdef12", "deadbeef")
 
         self.assertEqual(code, 1)
-        printed = "\n".join(str(c.args[0]) for c in mock_print.call_args_list)
-        self.assertIn("Insufficient fee", printed)
+        self.assertIn("Insufficient fee", err.getvalue())
         mock_transport.disconnect.assert_called_once()
 
     def test_disconnects_even_when_send_transaction_raises(self):
         mock_transport, _ = self._patch_transport_and_sender(
             send_side_effect=RuntimeError("boom")
         )
-        with patch("builtins.print"):
+        with _captured_output():
             with self.assertRaises(RuntimeError):
                 cli.run_send("!abcdef12", "deadbeef")
 
@@ -5,6 +5,7 @@ Unit tests for btcmesh_client_gui.py
 Tests the GUI logic, organized by story number from project/tasks.txt.
 """
 import sys
+import types
 import unittest
 import unittest.mock
 import queue
@@ -121,14 +122,17 @@ sys.modules['kivy.utils'] = kivy_mock
 pubsub_mock = unittest.mock.MagicMock()
 sys.modules['pubsub'] = pubsub_mock
 
-# Mock meshtastic (for device scanning tests)
-meshtastic_mock = unittest.mock.MagicMock()
-meshtastic_mock.util = unittest.mock.MagicMock()
+# Stub meshtastic (for device scanning tests). Plain modules exposing just
+# what scan_meshtastic_devices() imports; SerialInterface itself is never
+# reached because the tests patch MeshtasticSerialTransport.
+meshtastic_mock = types.ModuleType('meshtastic')
+meshtastic_mock.util = types.ModuleType('meshtastic.util')
 meshtastic_mock.util.blacklistVids = []
 meshtastic_mock.util.eliminate_duplicate_port = lambda ports: ports
+meshtastic_mock.serial_interface = types.ModuleType('meshtastic.serial_interface')
 sys.modules['meshtastic'] = meshtastic_mock
 sys.modules['meshtastic.util'] = meshtastic_mock.util
-sys.modules['meshtastic.serial_interface'] = unittest.mock.MagicMock()
+sys.modules['meshtastic.serial_interface'] = meshtastic_mock.serial_interface
 
 # Default serial port enumeration to "no devices" so tests that don't scan
 # explicitly aren't affected by whatever hardware happens to be attached to
@@ -190,110 +194,44 @@ from btcmesh_client_gui import (
 class TestSendButtonValidationStory91(unittest.TestCase):
     """Tests for validate_send_inputs() - Story 9.1: Send Transaction Button."""
 
-    def test_empty_destination_returns_error(self):
-        """Given empty destination, Then returns error message."""
-        result = validate_send_inputs("", "aabbccdd", True)
-        self.assertEqual(result, "Enter destination node ID")
-
-    def test_destination_without_exclamation_returns_error(self):
-        """Given destination without '!', Then returns error message."""
-        result = validate_send_inputs("abc123", "aabbccdd", True)
-        self.assertEqual(result, "Destination must start with '!'")
-
-    def test_empty_tx_hex_returns_error(self):
-        """Given empty tx_hex, Then returns error message."""
-        result = validate_send_inputs("!abc123", "", True)
-        self.assertEqual(result, "Enter transaction hex")
-
-    def test_odd_length_tx_hex_returns_error(self):
-        """Given tx_hex with odd length, Then returns error message."""
-        result = validate_send_inputs("!abc123", "aabbccd", True)
-        self.assertEqual(result, "Hex must have even length")
-
-    def test_invalid_hex_characters_returns_error(self):
-        """Given tx_hex with invalid characters, Then returns error message."""
-        result = validate_send_inputs("!abc123", "gghhiijj", True)
-        self.assertEqual(result, "Invalid hex characters")
-
-    def test_no_interface_returns_error(self):
-        """Given no Meshtastic interface, Then returns error message."""
-        result = validate_send_inputs("!abc123", "aabbccdd", False)
-        self.assertEqual(result, "Meshtastic not connected")
-
-    def test_valid_inputs_returns_none(self):
-        """Given all valid inputs, Then returns None."""
-        result = validate_send_inputs("!abc123", "aabbccdd", True)
-        self.assertIsNone(result)
-
-    def test_validation_order_checks_dest_first(self):
-        """Given multiple invalid inputs, Then checks destination first."""
-        result = validate_send_inputs("", "", False)
-        self.assertEqual(result, "Enter destination node ID")
-
-    def test_validation_order_checks_dest_format_second(self):
-        """Given invalid dest format and other errors, Then checks dest format second."""
-        result = validate_send_inputs("abc", "", False)
-        self.assertEqual(result, "Destination must start with '!'")
-
-    def test_validation_order_checks_tx_hex_third(self):
-        """Given empty tx_hex and no interface, Then checks tx_hex third."""
-        result = validate_send_inputs("!abc123", "", False)
-        self.assertEqual(result, "Enter transaction hex")
-
-    def test_whitespace_only_destination_returns_error(self):
-        """Given whitespace-only destination (after strip), Then returns error."""
-        result = validate_send_inputs("", "aabbccdd", True)
-        self.assertEqual(result, "Enter destination node ID")
-
-    def test_dry_run_without_interface_returns_none(self):
-        """Given dry_run=True and no Meshtastic interface, Then returns None (valid).
-
-        Story 6.5: Dry run should work without Meshtastic connection.
-        """
-        result = validate_send_inputs("!abc123", "aabbccdd", False, dry_run=True)
-        self.assertIsNone(result)
-
-    def test_dry_run_still_validates_other_inputs(self):
-        """Given dry_run=True but invalid hex, Then still returns error.
-
-        Story 6.5: Dry run should still validate destination and tx_hex.
-        """
-        result = validate_send_inputs("!abc123", "gghhiijj", False, dry_run=True)
-        self.assertEqual(result, "Invalid hex characters")
-
-    def test_non_dry_run_without_interface_returns_error(self):
-        """Given dry_run=False and no Meshtastic interface, Then returns error.
-
-        Ensures regular mode still requires Meshtastic connection.
-        """
-        result = validate_send_inputs("!abc123", "aabbccdd", False, dry_run=False)
-        self.assertEqual(result, "Meshtastic not connected")
-
-    def test_destination_same_as_own_node_returns_error(self):
-        """Given destination same as own node ID, Then returns error.
-
-        Story 11.2: Cannot send transaction to yourself.
-        """
-        own_node_id = "!abcd1234"
-        result = validate_send_inputs("!abcd1234", "aabbccdd", True, own_node_id=own_node_id)
-        self.assertEqual(result, "Cannot send to your own node")
-
-    def test_destination_different_from_own_node_returns_none(self):
-        """Given destination different from own node ID, Then returns None (valid).
-
-        Story 11.2: Sending to a different node should be allowed.
-        """
-        own_node_id = "!abcd1234"
-        result = validate_send_inputs("!efef5678", "aabbccdd", True, own_node_id=own_node_id)
-        self.assertIsNone(result)
-
-    def test_own_node_id_none_skips_validation(self):
-        """Given own_node_id is None, Then skips self-send validation.
-
-        When not connected, we don't know our own node ID.
-        """
-        result = validate_send_inputs("!abcd1234", "aabbccdd", True, own_node_id=None)
-        self.assertIsNone(result)
+    # (label, dest, tx_hex, has_iface, kwargs, expected error or None)
+    CASES = [
+        ("empty_destination", "", "aabbccdd", True, {}, "Enter destination node ID"),
+        ("destination_without_exclamation", "abc123", "aabbccdd", True, {},
+         "Destination must start with '!'"),
+        ("empty_tx_hex", "!abc123", "", True, {}, "Enter transaction hex"),
+        ("odd_length_tx_hex", "!abc123", "aabbccd", True, {}, "Hex must have even length"),
+        ("invalid_hex_characters", "!abc123", "gghhiijj", True, {}, "Invalid hex characters"),
+        ("no_interface", "!abc123", "aabbccdd", False, {}, "Meshtastic not connected"),
+        ("valid_inputs", "!abc123", "aabbccdd", True, {}, None),
+        # Validation order: destination, then its format, then tx hex
+        ("order_dest_first", "", "", False, {}, "Enter destination node ID"),
+        ("order_dest_format_second", "abc", "", False, {}, "Destination must start with '!'"),
+        ("order_tx_hex_third", "!abc123", "", False, {}, "Enter transaction hex"),
+        # Destination is passed in already stripped, so whitespace-only arrives empty
+        ("whitespace_only_destination", "", "aabbccdd", True, {}, "Enter destination node ID"),
+        # Story 6.5: dry run works without a Meshtastic connection but
+        # still validates destination and tx_hex
+        ("dry_run_without_interface", "!abc123", "aabbccdd", False, {"dry_run": True}, None),
+        ("dry_run_still_validates_hex", "!abc123", "gghhiijj", False, {"dry_run": True},
+         "Invalid hex characters"),
+        ("non_dry_run_without_interface", "!abc123", "aabbccdd", False, {"dry_run": False},
+         "Meshtastic not connected"),
+        # Story 11.2: cannot send a transaction to yourself; unknown own
+        # node ID (not connected) skips the check
+        ("destination_same_as_own_node", "!abcd1234", "aabbccdd", True,
+         {"own_node_id": "!abcd1234"}, "Cannot send to your own node"),
+        ("destination_different_from_own_node", "!efef5678", "aabbccdd", True,
+         {"own_node_id": "!abcd1234"}, None),
+        ("own_node_id_none_skips_check", "!abcd1234", "aabbccdd", True,
+         {"own_node_id": None}, None),
+    ]
+
+    def test_validate_send_inputs(self):
+        """Given each input combination in CASES, Then returns the expected error message (or None if valid)."""
+        for label, dest, tx_hex, has_iface, kwargs, expected in self.CASES:
+            with self.subTest(label):
+                self.assertEqual(validate_send_inputs(dest, tx_hex, has_iface, **kwargs), expected)
 
     def test_cli_finished_success_stops_sending(self):
         """Given 'cli_finished' with exit code 0, Then stops sending and shows success."""
@@ -345,14 +283,14 @@ class TestConnectionStatusStory101(unittest.TestCase):
 
     def test_connected_result_sets_connection_info(self):
         """Given 'connected' result, Then sets connection text, color, and stores iface."""
-        mock_iface = unittest.mock.MagicMock()
-        result = ('connected', mock_iface, '!abc123')
+        iface = unittest.mock.sentinel.iface
+        result = ('connected', iface, '!abc123')
 
         action = process_result(result)
 
         self.assertEqual(action.connection_text, 'Meshtastic: Connected (!abc123)')
         self.assertEqual(action.connection_color, COLOR_SUCCESS)
-        self.assertEqual(action.store_iface, mock_iface)
+        self.assertIs(action.store_iface, iface)
         self.assertEqual(len(action.log_messages), 1)
         self.assertIn('Connected to Meshtastic device: !abc123', action.log_messages[0][0])
 
@@ -457,35 +395,26 @@ class TestPopupsStory103(unittest.TestCase):
 class TestTransactionSenderResultsStory222(unittest.TestCase):
     """Tests for TransactionSender result types - Story 22.2."""
 
-    def test_chunk_sending_first_attempt(self):
-        """Given chunk_sending result with attempt=1, Then shows 'Sending chunk X/Y...'."""
-        result = ('chunk_sending', 1, 3, 1)
-
-        action = process_result(result)
-
-        self.assertEqual(len(action.log_messages), 1)
-        self.assertIn('Sending chunk 1/3', action.log_messages[0][0])
-        self.assertNotIn('retry', action.log_messages[0][0])
-        self.assertEqual(action.log_messages[0][1], COLOR_PRIMARY)
-
-    def test_chunk_sending_with_retry(self):
-        """Given chunk_sending result with attempt=2, Then shows retry message."""
-        result = ('chunk_sending', 2, 3, 2)
-
-        action = process_result(result)
-
-        self.assertEqual(len(action.log_messages), 1)
-        self.assertIn('Sending chunk 2/3', action.log_messages[0][0])
-        self.assertIn('retry 1', action.log_messages[0][0])
-        self.assertEqual(action.log_messages[0][1], COLOR_PRIMARY)
-
-    def test_chunk_sending_with_multiple_retries(self):
-        """Given chunk_sending result with attempt=3, Then shows correct retry count."""
-        result = ('chunk_sending', 1, 5, 3)
-
-        action = process_result(result)
-
-        self.assertIn('retry 2', action.log_messages[0][0])
+    def test_chunk_sending_shows_chunk_and_retry_count(self):
+        """Given chunk_sending results for various attempts, Then shows 'Sending chunk X/Y...' with the retry count after the first attempt."""
+        # (chunk_num, total, attempt, expected text, expected retry text)
+        cases = [
+            (1, 3, 1, 'Sending chunk 1/3', None),
+            (2, 3, 2, 'Sending chunk 2/3', 'retry 1'),
+            (1, 5, 3, 'Sending chunk 1/5', 'retry 2'),
+        ]
+        for chunk_num, total, attempt, expected, expected_retry in cases:
+            with self.subTest(attempt=attempt):
+                action = process_result(('chunk_sending', chunk_num, total, attempt))
+
+                self.assertEqual(len(action.log_messages), 1)
+                message, color = action.log_messages[0]
+                self.assertIn(expected, message)
+                if expected_retry is None:
+                    self.assertNotIn('retry', message)
+                else:
+                    self.assertIn(expected_retry, message)
+                self.assertEqual(color, COLOR_PRIMARY)
 
     def test_wire_sent_shows_protocol_detail(self):
         """Given wire_sent result, Then shows arrow and wire format in secondary color."""
@@ -579,6 +508,12 @@ class TestTransactionSenderResultsStory222(unittest.TestCase):
         self.assertIn('aborted', action.log_messages[0][0].lower())
         self.assertEqual(action.log_messages[0][1], COLOR_WARNING)
 
+    def test_unknown_result_type_returns_empty_action(self):
+        """Given a result type with no handler, Then returns a default ResultAction."""
+        action = process_result(('unknown_type', 'payload'))
+
+        self.assertEqual(action, ResultAction())
+
 
 
 # Story 11.1: Device Selection Dropdown
@@ -96,9 +96,11 @@ class TestRunServerConnection(unittest.TestCase):
     def test_keyboard_interrupt_disconnects_and_returns_0(self):
         """Given the server is already running its main loop (has completed
         at least one full tick), When a KeyboardInterrupt (Ctrl+C) arrives,
-        Then it disconnects the transport and returns 0 instead of letting
-        the exception propagate."""
+        Then it disconnects the transport, closes the RPC client (stopping
+        its keepalive thread) and returns 0 instead of letting the
+        exception propagate."""
         self._patch_successful_startup()
+        mock_rpc = cli.BitcoinRPCClient.return_value
         with patch("btcmesh_server_cli.MeshtasticSerialTransport") as mock_transport_cls, \
                 patch("btcmesh_server_cli.get_meshtastic_serial_port", return_value="/dev/ttyUSB0"), \
                 patch("btcmesh_server_cli.time.sleep", side_effect=[None, KeyboardInterrupt]) as mock_sleep:
@@ -115,6 +117,7 @@ class TestRunServerConnection(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 2)
         self.assertEqual(code, 0)
         mock_transport.disconnect.assert_called_once()
+        mock_rpc.close.assert_called_once()
 
 
 class TestRunServerDeviceWatchdog(unittest.TestCase):
@@ -1353,6 +1353,45 @@ class TestMeshtasticDeviceSettingsStory182(unittest.TestCase):
                         target_fn()
                         mock_transport_cls.return_value.connect.assert_called_once_with('/dev/ttyUSB0')
 
+    def _run_server_body(self, btcmesh_server_gui, mock_threading):
+        gui = btcmesh_server_gui.BTCMeshServerGUI()
+        gui._stop_event.is_set.return_value = True
+        gui.rpc_host_input.text = 'localhost'
+        gui.rpc_port_input.text = '8332'
+        gui.rpc_user_input.text = 'user'
+        gui.rpc_password_input.text = 'password'
+        gui.on_start_pressed(None)
+        thread_call = mock_threading.Thread.call_args
+        target_fn = thread_call.kwargs.get('target') or thread_call[1].get('target')
+        target_fn()
+
+    def test_stopping_server_closes_rpc_client(self):
+        """Given the server loop exits, Then the RPC client is closed so its
+        keepalive thread does not outlive the Start/Stop cycle."""
+        import btcmesh_server_gui
+
+        with unittest.mock.patch.object(btcmesh_server_gui, 'Clock'):
+            with unittest.mock.patch.object(btcmesh_server_gui, 'threading') as mock_threading:
+                with unittest.mock.patch.object(btcmesh_server_gui, 'MeshtasticSerialTransport'), \
+                     unittest.mock.patch.object(btcmesh_server_gui, 'BitcoinRPCClient') as mock_rpc_cls, \
+                     unittest.mock.patch.object(btcmesh_server_gui, 'TransactionReceiver'):
+                    self._run_server_body(btcmesh_server_gui, mock_threading)
+        mock_rpc_cls.return_value.close.assert_called_once()
+
+    def test_init_error_closes_rpc_client(self):
+        """Given TransactionReceiver fails to initialise, Then the RPC client
+        is still closed before run_server() returns."""
+        import btcmesh_server_gui
+
+        with unittest.mock.patch.object(btcmesh_server_gui, 'Clock'):
+            with unittest.mock.patch.object(btcmesh_server_gui, 'threading') as mock_threading:
+                with unittest.mock.patch.object(btcmesh_server_gui, 'MeshtasticSerialTransport'), \
+                     unittest.mock.patch.object(btcmesh_server_gui, 'BitcoinRPCClient') as mock_rpc_cls, \
+                     unittest.mock.patch.object(btcmesh_server_gui, 'TransactionReceiver',
+                                                side_effect=ValueError('bad timeout')):
+                    self._run_server_body(btcmesh_server_gui, mock_threading)
+        mock_rpc_cls.return_value.close.assert_called_once()
+
 
 class TestReassemblyTimeoutSettingsStory183(unittest.TestCase):
     """Tests for Story 18.3: Reassembly Timeout Settings."""
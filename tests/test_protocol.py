@@ -179,6 +179,11 @@ class TestHexValidation(unittest.TestCase):
     def test_invalid_hex_spaces(self):
         self.assertFalse(is_valid_hex("dead beef"))
 
+    def test_invalid_hex_int_literal_forms(self):
+        for s in ("0xdeadbeef", "dead_beef", " deadbeef", "deadbeef\n", "+dead"):
+            with self.subTest(s=s):
+                self.assertFalse(is_valid_hex(s))
+
     def test_validate_tx_hex_valid(self):
         validate_transaction_hex("deadbeef")  # Should not raise
 
@@ -87,6 +87,44 @@ class TestTransactionReassemblerStory21(unittest.TestCase):
         )
 
 
+class TestChunkStorage(unittest.TestCase):
+    def setUp(self):
+        self.logger_patcher = patch("core.reassembler.server_logger", MagicMock())
+        self.logger_patcher.start()
+        self.reassembler = TransactionReassembler(timeout_seconds=1)
+        self.sender_id = "!3039"
+        self.session_id = "store"
+
+    def tearDown(self):
+        self.logger_patcher.stop()
+
+    def test_session_chunks_presized_to_total_chunks(self):
+        """Given a new session, When its first chunk arrives, Then chunk slots for every chunk are allocated."""
+        self.reassembler.add_chunk(self.sender_id, f"BTC_TX|{self.session_id}|2/3|BBB")
+        session = self.reassembler.active_sessions[self.sender_id][self.session_id]
+        self.assertEqual(session["chunks"], [None, "BBB", None])
+        self.assertEqual(session["received_count"], 1)
+
+    def test_out_of_order_chunks_reassemble_in_order(self):
+        """Given chunks arriving out of order, When the last arrives, Then payload is joined in chunk order."""
+        self.assertIsNone(self.reassembler.add_chunk(self.sender_id, f"BTC_TX|{self.session_id}|3/3|CCC"))
+        self.assertIsNone(self.reassembler.add_chunk(self.sender_id, f"BTC_TX|{self.session_id}|1/3|AAA"))
+        result = self.reassembler.add_chunk(self.sender_id, f"BTC_TX|{self.session_id}|2/3|BBB")
+        self.assertEqual(result, "AAABBBCCC")
+        self.assertEqual(self.reassembler.active_sessions, {})
+
+    def test_total_chunks_above_maximum_rejected(self):
+        """Given total_chunks above MAX_TOTAL_CHUNKS, When parsed, Then InvalidChunkFormatError is raised."""
+        from core.constants import MAX_TOTAL_CHUNKS
+        from core.reassembler import InvalidChunkFormatError
+
+        with self.assertRaises(InvalidChunkFormatError):
+            self.reassembler.add_chunk(
+                self.sender_id, f"BTC_TX|{self.session_id}|1/{MAX_TOTAL_CHUNKS + 1}|AAA"
+            )
+        self.assertEqual(self.reassembler.active_sessions, {})
+
+
 class TestHexValidationStory22(unittest.TestCase):
     def setUp(self):
         from core.reassembler import TransactionReassembler
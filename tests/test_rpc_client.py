@@ -5,10 +5,28 @@ exercise BitcoinRPCClient directly and have no dependency on
 btcmesh_server.py, they were just historically written before the RPC
 client was extracted into its own core/ module.
 """
+import json
 import unittest
 from unittest.mock import MagicMock
 
 
+def rpc_body(reply):
+    """Encode a JSON-RPC reply the way bitcoind sends it (response.content)."""
+    return json.dumps(reply).encode()
+
+
+def _make_client():
+    """A localhost client; construction makes no request unless eager_probe is set."""
+    from core.rpc_client import BitcoinRPCClient
+
+    return BitcoinRPCClient({
+        'user': 'testuser',
+        'password': 'testpass',
+        'host': 'localhost',
+        'port': 8332,
+    })
+
+
 class TestBitcoinRpcConnectionStory42(unittest.TestCase):
     def setUp(self):
         self.valid_config = {
@@ -20,27 +38,137 @@ class TestBitcoinRpcConnectionStory42(unittest.TestCase):
 
     def test_valid_config_node_reachable(self):
         """Given valid config and node reachable, When connecting, Then connection is established."""
-        with unittest.mock.patch("core.rpc_client.requests.post") as mock_post:
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
             from core.rpc_client import BitcoinRPCClient
 
             # Configure the mock to return a successful response
             mock_response = MagicMock()
-            mock_response.json.return_value = {"result": {"chain": "main"}, "error": None}
+            mock_response.content = rpc_body({"result": {"chain": "main"}, "error": None})
             mock_post.return_value = mock_response
 
             # Call the method
-            rpc = BitcoinRPCClient(self.valid_config)
+            rpc = BitcoinRPCClient(self.valid_config, eager_probe=True)
 
             # Assertions
             self.assertIsNotNone(rpc)
             mock_post.assert_called_once_with(
-                rpc.uri,
-                data='{"jsonrpc": "1.0", "id": "btcmesh", "method": "getblockchaininfo", "params": []}',
-                headers={'Content-Type': 'application/json'},
-                proxies={},
+                rpc.rpc_url,
+                data=b'{"jsonrpc":"1.0","id":"btcmesh","method":"getblockchaininfo","params":[]}',
                 timeout=30
             )
 
+    def test_onion_host_sets_tor_proxy_on_session(self):
+        """Given a .onion host, When client built, Then the Tor SOCKS proxy is configured on the session."""
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
+            from core.rpc_client import BitcoinRPCClient, TOR_SOCKS_PROXY
+
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+            config = dict(self.valid_config, host="abcdefghijklmnop.onion")
+            rpc = BitcoinRPCClient(config, eager_probe=True)
+
+            self.assertTrue(rpc.use_tor)
+            self.assertEqual(rpc._session.proxies, {'http': TOR_SOCKS_PROXY, 'https': TOR_SOCKS_PROXY})
+            self.assertNotIn('proxies', mock_post.call_args.kwargs)
+
+    def test_onion_host_ignores_environment_proxy(self):
+        """Given http_proxy set in the environment, When calling a .onion host, Then the Tor SOCKS proxy is still used."""
+        import os
+        import requests
+        from core.rpc_client import BitcoinRPCClient, TOR_SOCKS_PROXY, _HTTP_ADAPTER
+
+        config = dict(self.valid_config, host="abcdefghijklmnop.onion")
+        rpc = BitcoinRPCClient(config)
+        with unittest.mock.patch.dict(os.environ, {"http_proxy": "http://10.9.9.9:3128"}), \
+                unittest.mock.patch.object(_HTTP_ADAPTER, "send") as mock_send:
+            mock_send.side_effect = requests.exceptions.ConnectionError("stop here")
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                rpc.rpc_request("sendrawtransaction", ["00"])
+
+        self.assertEqual(mock_send.call_args.kwargs["proxies"]["http"], TOR_SOCKS_PROXY)
+
+    def test_clearnet_host_has_no_session_proxy(self):
+        """Given a clearnet host, When client built, Then no proxy is configured on the session."""
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
+            from core.rpc_client import BitcoinRPCClient
+
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+            rpc = BitcoinRPCClient(self.valid_config, eager_probe=True)
+
+            self.assertFalse(rpc.use_tor)
+            self.assertEqual(rpc._session.proxies, {})
+
+    def test_credentials_on_session_not_in_url(self):
+        """Given user/password, When client built, Then they go to session auth and the URL has none."""
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
+            from core.rpc_client import BitcoinRPCClient
+
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+            rpc = BitcoinRPCClient(self.valid_config, eager_probe=True)
+
+            self.assertEqual(rpc.rpc_url, "http://127.0.0.1:8332")
+            self.assertEqual(rpc._session.auth, ("testuser", "testpass"))
+            self.assertEqual(rpc._session.headers['Content-Type'], 'application/json')
+
+    def test_clients_share_one_connection_pool(self):
+        """Given two clients, When built, Then both sessions use the same HTTP adapter, and close() leaves it open."""
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
+            from core.rpc_client import BitcoinRPCClient
+
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+            first = BitcoinRPCClient(self.valid_config, eager_probe=True)
+            second = BitcoinRPCClient(self.valid_config, eager_probe=True)
+            shared = first._session.get_adapter(first.rpc_url)
+
+            self.assertIs(second._session.get_adapter(second.rpc_url), shared)
+            with unittest.mock.patch.object(shared, 'close') as mock_close:
+                first.close()
+            mock_close.assert_not_called()
+
+    def test_connection_pool_never_blocks_when_full(self):
+        """Given every pooled connection is checked out, When another call needs one, Then a new connection is opened instead of waiting."""
+        from core.rpc_client import _HTTP_ADAPTER
+
+        pool = _HTTP_ADAPTER.poolmanager.connection_from_url("http://localhost:8332")
+        held = [pool._get_conn() for _ in range(pool.pool.maxsize)]
+        try:
+            # A blocking pool with no pool_timeout would hang here forever
+            extra = pool._get_conn(timeout=0)
+            self.assertNotIn(extra, held)
+        finally:
+            for conn in held:
+                pool._put_conn(conn)
+
+    def test_session_reused_across_calls(self):
+        """Given a connected client, When several RPCs are made, Then they all go through one session."""
+        with unittest.mock.patch("core.rpc_client.requests.Session") as mock_session_cls:
+            from core.rpc_client import BitcoinRPCClient
+
+            session = mock_session_cls.return_value
+            session.post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+            rpc = BitcoinRPCClient(self.valid_config, eager_probe=True)
+            rpc.sendrawtransaction("00")
+            rpc.close()
+
+            mock_session_cls.assert_called_once_with()
+            self.assertEqual(session.post.call_count, 2)
+            session.close.assert_called_once_with()
+
+
+    def test_construction_without_probe_makes_no_request(self):
+        """Given valid config, When constructed without eager_probe, Then no RPC is made until connect()."""
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
+            from core.rpc_client import BitcoinRPCClient
+
+            mock_post.return_value.content = rpc_body({"result": {"chain": "signet"}, "error": None})
+            rpc = BitcoinRPCClient(self.valid_config)
+
+            mock_post.assert_not_called()
+            self.assertIsNone(rpc.chain)
+
+            rpc.connect()
+
+            mock_post.assert_called_once()
+            self.assertEqual(rpc.chain, "signet")
 
     def test_non_int_port_invalid_config_raises(self):
         """Given invalid config, When connecting, Then error is raised."""
@@ -80,18 +208,18 @@ class TestBitcoinRpcConnectionStory42(unittest.TestCase):
 
     def test_rpc_request_retries_on_connection_error_three_times_last_success(self):
         """Given valid config but node unreachable, When connecting, retries twice, succeeds on third try."""
-        with unittest.mock.patch("core.rpc_client.requests.post") as mock_post:
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
             from core.rpc_client import BitcoinRPCClient
 
             # Mock the response to raise ConnectionError for the first two calls and success on last
             mock_post.side_effect = [
                 ConnectionError("Connection error"),
                 ConnectionError("Connection error"),
-                MagicMock(json=MagicMock(return_value={"result": {"chain": "main"}, "error": None}))
+                MagicMock(content=rpc_body({"result": {"chain": "main"}, "error": None}))
             ]
 
             # Call the method
-            rpc = BitcoinRPCClient(self.valid_config)
+            rpc = BitcoinRPCClient(self.valid_config, eager_probe=True)
 
             # Assertions
             self.assertIsNotNone(rpc)
@@ -99,17 +227,17 @@ class TestBitcoinRpcConnectionStory42(unittest.TestCase):
 
     def test_rpc_request_retries_on_connection_error_second_success(self):
         """Given valid config but node unreachable on first try, retries and suceeds on second try."""
-        with unittest.mock.patch("core.rpc_client.requests.post") as mock_post:
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
             from core.rpc_client import BitcoinRPCClient
 
             # Mock the response to raise ConnectionError for the first call and success on the second
             mock_post.side_effect = [
                 ConnectionError("Connection error"),
-                MagicMock(json=MagicMock(return_value={"result": {"chain": "main"}, "error": None}))
+                MagicMock(content=rpc_body({"result": {"chain": "main"}, "error": None}))
             ]
 
             # Call the method
-            rpc = BitcoinRPCClient(self.valid_config)
+            rpc = BitcoinRPCClient(self.valid_config, eager_probe=True)
 
             # Assertions
             self.assertIsNotNone(rpc)
@@ -117,7 +245,7 @@ class TestBitcoinRpcConnectionStory42(unittest.TestCase):
 
     def test_rpc_request_retries_on_connection_error_three_times_failure(self):
         """Given valid config but node unreachable, When connecting, retries 3 times, fails."""
-        with unittest.mock.patch("core.rpc_client.requests.post") as mock_post:
+        with unittest.mock.patch("core.rpc_client.requests.Session.post") as mock_post:
             from core.rpc_client import BitcoinRPCClient
 
             # Mock the response to raise ConnectionError
@@ -126,42 +254,277 @@ class TestBitcoinRpcConnectionStory42(unittest.TestCase):
             # Assert that the ConnectionError is raised after 3 attempts
             with self.assertRaises(ConnectionError) as context:
                 # Call the method
-                rpc = BitcoinRPCClient(self.valid_config)
+                rpc = BitcoinRPCClient(self.valid_config, eager_probe=True)
 
             # Assertions
             self.assertTrue("Connection error" in str(context.exception))
             self.assertEqual(mock_post.call_count, 3)  # Ensure post was called three times
 
 
+class TestRpcJsonCodec(unittest.TestCase):
+    def test_stdlib_fallback_matches_compact_encoding(self):
+        """Given orjson is unavailable, When encoding/decoding, Then stdlib json produces the same compact bytes."""
+        from core import rpc_client
+
+        payload = {"jsonrpc": "1.0", "id": "btcmesh", "method": "getblockchaininfo", "params": []}
+        with unittest.mock.patch.object(rpc_client, "orjson", None):
+            encoded = rpc_client._json_dumps(payload)
+            decoded = rpc_client._json_loads(encoded)
+
+        self.assertEqual(
+            encoded, b'{"jsonrpc":"1.0","id":"btcmesh","method":"getblockchaininfo","params":[]}'
+        )
+        self.assertEqual(decoded, payload)
+
+
+class TestBitcoinRpcRetryBackoff(unittest.TestCase):
+    def setUp(self):
+        self.client = _make_client()
+
+    def test_retry_delays_grow_exponentially_with_jitter(self):
+        """Given repeated connection errors, When retrying, Then waits double each time and are jittered."""
+        import requests
+
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post, \
+                unittest.mock.patch("core.rpc_client.time.sleep") as mock_sleep, \
+                unittest.mock.patch("core.rpc_client.random.random", return_value=1.0):
+            mock_post.side_effect = requests.exceptions.ConnectionError("refused")
+
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.client.rpc_request("getblockchaininfo", retries=4)
+
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0, 2.0])
+
+    def test_retry_delay_jitter_and_cap(self):
+        """Given minimal jitter and a low cap, When retrying, Then the wait is halved and never exceeds the cap."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post, \
+                unittest.mock.patch("core.rpc_client.time.sleep") as mock_sleep, \
+                unittest.mock.patch("core.rpc_client.random.random", return_value=0.0):
+            mock_post.side_effect = ConnectionError("refused")
+
+            with self.assertRaises(ConnectionError):
+                self.client.rpc_request("getblockchaininfo", retries=4, backoff_cap=1.0)
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.25, 0.5, 0.5])
+
+    def test_sendrawtransaction_not_retried_on_connection_error(self):
+        """Given a connection error during broadcast, When sending, Then it is not resent."""
+        import requests
+
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post, \
+                unittest.mock.patch("core.rpc_client.time.sleep") as mock_sleep:
+            mock_post.side_effect = requests.exceptions.ConnectionError("reset")
+
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.client.sendrawtransaction("00")
+
+        self.assertEqual(mock_post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_other_methods_retried_by_default(self):
+        """Given a read-only method with no retry policy of its own, When it keeps failing, Then it gets the default three attempts."""
+        import requests
+
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post, \
+                unittest.mock.patch("core.rpc_client.time.sleep"):
+            mock_post.side_effect = requests.exceptions.ConnectionError("refused")
+
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.client.rpc_request("getrawtransaction", ["ab" * 32])
+
+        self.assertEqual(mock_post.call_count, 3)
+
+    def test_explicit_retries_honoured_for_broadcast(self):
+        """Given a caller that asks for retries explicitly, When broadcasting, Then that count is used."""
+        import requests
+
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post, \
+                unittest.mock.patch("core.rpc_client.time.sleep"):
+            mock_post.side_effect = requests.exceptions.ConnectionError("refused")
+
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.client.rpc_request("sendrawtransaction", ["00"], retries=2)
+
+        self.assertEqual(mock_post.call_count, 2)
+
+
+class TestBitcoinRpcBatchCall(unittest.TestCase):
+    def setUp(self):
+        self.client = _make_client()
+
+    def test_batch_call_sends_one_request_and_orders_results(self):
+        """Given several calls, When batch_call is used, Then one POST is made and results follow call order."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body([
+                {"id": 1, "result": 5, "error": None},
+                {"id": 0, "result": {"chain": "main"}, "error": None},
+            ])
+
+            results = self.client.batch_call([
+                ("getblockchaininfo", None),
+                ("getconnectioncount", []),
+            ])
+
+        self.assertEqual(results, [{"chain": "main"}, 5])
+        mock_post.assert_called_once()
+        sent = json.loads(mock_post.call_args.kwargs['data'])
+        self.assertEqual([c["method"] for c in sent], ["getblockchaininfo", "getconnectioncount"])
+        self.assertEqual([c["id"] for c in sent], [0, 1])
+
+    def test_batch_call_raises_on_element_error(self):
+        """Given a batch where one call fails, When batch_call is used, Then BitcoinRPCException is raised."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body([
+                {"id": 0, "result": None, "error": {"code": -32601, "message": "Method not found"}},
+            ])
+
+            with self.assertRaises(self.client.BitcoinRPCException) as ctx:
+                self.client.batch_call([("nosuchmethod", None)])
+
+        self.assertEqual(ctx.exception.code, -32601)
+
+    def test_batch_call_empty_makes_no_request(self):
+        """Given no calls, When batch_call is used, Then no request is sent."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            self.assertEqual(self.client.batch_call([]), [])
+        mock_post.assert_not_called()
+
+    def test_batch_call_raises_on_non_list_reply(self):
+        """Given the node answers the batch with a single error object, When batch_call is used, Then that error is raised."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body(
+                {"id": None, "result": None, "error": {"code": -32700, "message": "Parse error"}}
+            )
+
+            with self.assertRaises(self.client.BitcoinRPCException) as ctx:
+                self.client.batch_call([("getblockchaininfo", None)])
+
+        self.assertEqual(ctx.exception.code, -32700)
+
+    def test_batch_call_raises_on_missing_reply(self):
+        """Given fewer replies than calls, When batch_call is used, Then BitcoinRPCException is raised instead of short results."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body([
+                {"id": 0, "result": {"chain": "main"}, "error": None},
+            ])
+
+            with self.assertRaises(self.client.BitcoinRPCException):
+                self.client.batch_call([
+                    ("getblockchaininfo", None),
+                    ("getconnectioncount", None),
+                ])
+
+    def test_batch_call_raises_on_unexpected_ids(self):
+        """Given replies whose ids don't match the calls sent, When batch_call is used, Then BitcoinRPCException is raised."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body([
+                {"id": 0, "result": {"chain": "main"}, "error": None},
+                {"id": 0, "result": 5, "error": None},
+            ])
+
+            with self.assertRaises(self.client.BitcoinRPCException):
+                self.client.batch_call([
+                    ("getblockchaininfo", None),
+                    ("getconnectioncount", None),
+                ])
+
+
+class TestBitcoinRpcCache(unittest.TestCase):
+    def setUp(self):
+        self.client = _make_client()
+
+    def test_getblockchaininfo_cached_within_ttl(self):
+        """Given a recent getblockchaininfo result, When called again within the TTL, Then no new request is sent."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+
+            first = self.client.getblockchaininfo()
+            second = self.client.getblockchaininfo()
+
+        self.assertEqual(first, {"chain": "main"})
+        self.assertEqual(second, {"chain": "main"})
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_getblockchaininfo_refetched_after_ttl(self):
+        """Given a cached result older than the TTL, When called again, Then a new request is sent."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post, \
+                unittest.mock.patch("core.rpc_client.time.monotonic", side_effect=[100.0, 200.0, 200.0]):
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+
+            self.client.getblockchaininfo()
+            self.client.getblockchaininfo()
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_connect_result_reused_by_getblockchaininfo(self):
+        """Given connect() just ran, When getblockchaininfo is called, Then no second request is made."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body({"result": {"chain": "test", "blocks": 7}, "error": None})
+
+            self.client.connect()
+            info = self.client.getblockchaininfo()
+
+        self.assertEqual(info["blocks"], 7)
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_getblockchaininfo_fresh_bypasses_cache(self):
+        """Given a cached result, When getblockchaininfo(fresh=True) is called, Then the node is queried again."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+
+            self.client.getblockchaininfo()
+            self.client.getblockchaininfo(fresh=True)
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_keepalive_pings_until_closed(self):
+        """Given start_keepalive, When the interval elapses, Then getblockchaininfo is called until close()."""
+        import threading
+
+        pinged = threading.Event()
+        with unittest.mock.patch.object(
+            self.client, 'getblockchaininfo', side_effect=lambda: pinged.set()
+        ) as mock_info:
+            self.client.start_keepalive(interval=0.01)
+            self.client.start_keepalive(interval=0.01)  # no second thread
+            self.assertTrue(pinged.wait(2))
+            thread = self.client._keepalive_thread
+            self.client.close()
+            thread.join(2)
+
+        self.assertFalse(thread.is_alive())
+        self.assertGreaterEqual(mock_info.call_count, 1)
+
+    def test_sendrawtransaction_invalidates_cache(self):
+        """Given a cached getblockchaininfo, When a transaction is sent, Then the next call hits the node."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body({"result": {"chain": "main"}, "error": None})
+
+            self.client.getblockchaininfo()
+            self.client.sendrawtransaction("00")
+            self.client.getblockchaininfo()
+
+        self.assertEqual(mock_post.call_count, 3)
+
+
 class TestBitcoinRpcBroadcastStory43(unittest.TestCase):
     def setUp(self):
-        self.config = {
-            'user': 'testuser',
-            'password': 'testpass',
-            'host': 'localhost',
-            'port': 8332
-        }
-        self.valid_tx_hex = "0100000001abcdef..."
+        self.client = _make_client()
+        self.valid_tx_hex = "01000000" + "01" + "ab" * 40 + "ffffffff" + "01" + "00" * 9 + "00000000"
         self.txid = "deadbeefcafebabe1234567890abcdef1234567890abcdef"
 
     def test_successful_broadcast_returns_txid(self):
         """Given valid hex and RPC connection, When broadcast, Then TXID is returned."""
-        from core.rpc_client import BitcoinRPCClient
-
-        # Mock connect to prevent actual connection, and requests.post for the broadcast call
-        with unittest.mock.patch.object(BitcoinRPCClient, 'connect'), \
-            unittest.mock.patch('requests.post') as mock_post:
-            # Create client (connect is mocked so no actual connection)
-            client = BitcoinRPCClient(self.config)
-
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
             # Simulate a successful response from the RPC server
-            mock_post.return_value.json.return_value = {
+            mock_post.return_value.content = rpc_body({
                 "result": self.txid,
                 "error": None
-            }
+            })
 
             # Call the method
-            txid, error = client.broadcast_transaction(self.valid_tx_hex)
+            txid, error = self.client.broadcast_transaction(self.valid_tx_hex)
 
             # Assertions
             self.assertEqual(txid, self.txid, "TXID returned should match expected TXID.")
@@ -169,38 +532,82 @@ class TestBitcoinRpcBroadcastStory43(unittest.TestCase):
 
     def test_rpc_error_returns_error_message(self):
         """Given valid hex but RPC error, When broadcast, Then error message is returned."""
-        from core.rpc_client import BitcoinRPCClient
-
-        with unittest.mock.patch.object(BitcoinRPCClient, 'connect'), \
-            unittest.mock.patch('requests.post') as mock_post:
-            client = BitcoinRPCClient(self.config)
-
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
             # Simulate an error response from the RPC server
-            mock_post.return_value.json.return_value = {
+            mock_post.return_value.content = rpc_body({
                 "result": None,
                 "error": {"code": -26, "message": "txn-mempool-conflict"}
-            }
+            })
 
             # Call the method
-            txid, error = client.broadcast_transaction(self.valid_tx_hex)
+            txid, error = self.client.broadcast_transaction(self.valid_tx_hex)
 
             # Assertions
             self.assertIsNone(txid)
             self.assertIn("txn-mempool-conflict", error)
 
+    def test_sendrawtransaction_body_is_valid_json(self):
+        """Given hex and a fee rate, When sent, Then the pre-built request decodes to the expected JSON-RPC call."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body({"result": self.txid, "error": None})
+
+            self.assertEqual(self.client.sendrawtransaction(self.valid_tx_hex, 0.1), self.txid)
+
+        self.assertEqual(json.loads(mock_post.call_args.kwargs['data']), {
+            "jsonrpc": "1.0",
+            "id": "btcmesh",
+            "method": "sendrawtransaction",
+            "params": [self.valid_tx_hex, 0.1],
+        })
+
+    def test_sendrawtransaction_non_hex_is_escaped(self):
+        """Given a non-hex string, When sent, Then it is JSON-escaped rather than spliced in."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            mock_post.return_value.content = rpc_body({"result": None, "error": {"code": -22, "message": "TX decode failed"}})
+
+            with self.assertRaises(self.client.BitcoinRPCException):
+                self.client.sendrawtransaction('ab"]}', 0.0)
+
+        self.assertEqual(json.loads(mock_post.call_args.kwargs['data'])["params"], ['ab"]}', 0.0])
+
+    def test_raw_tx_hex_not_formatted_when_debug_disabled(self):
+        """Given DEBUG logging disabled, When broadcasting, Then the raw tx hex is passed lazily, not pre-formatted."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post, \
+                unittest.mock.patch('core.rpc_client.server_logger') as mock_logger:
+            mock_post.return_value.content = rpc_body({"result": self.txid, "error": None})
+
+            self.client.broadcast_transaction(self.valid_tx_hex)
+
+        for call in mock_logger.debug.call_args_list:
+            self.assertNotIn(self.valid_tx_hex, call.args[0])
+
+    def test_obviously_invalid_hex_rejected_without_rpc(self):
+        """Given hex that fails quick_reject, When broadcast, Then the error is returned and no RPC is made."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            txid, error = self.client.broadcast_transaction("zz" * 80)
+
+            self.assertIsNone(txid)
+            self.assertEqual(error, "Invalid hex")
+            mock_post.assert_not_called()
+
+    def test_non_string_input_returns_error(self):
+        """Given a non-str payload, When broadcast, Then (None, error) is returned instead of raising."""
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
+            txid, error = self.client.broadcast_transaction(None)
+
+            self.assertIsNone(txid)
+            self.assertTrue(error)
+            mock_post.assert_not_called()
+
     def test_no_rpc_connection_returns_error(self):
         """Given connection failure during broadcast, Then txid=None and error message is returned."""
-        from core.rpc_client import BitcoinRPCClient
         import requests
 
-        with unittest.mock.patch.object(BitcoinRPCClient, 'connect'), \
-            unittest.mock.patch('requests.post') as mock_post:
-            client = BitcoinRPCClient(self.config)
-
+        with unittest.mock.patch.object(self.client._session, 'post') as mock_post:
             # Simulate connection failure when trying to broadcast
             mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
 
-            txid, error = client.broadcast_transaction(self.valid_tx_hex)
+            txid, error = self.client.broadcast_transaction(self.valid_tx_hex)
 
             self.assertIsNone(txid)
             self.assertIsNotNone(error)
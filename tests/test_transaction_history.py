@@ -4,6 +4,7 @@ import json
 import os
 import tempfile
 import unittest
+import unittest.mock
 from pathlib import Path
 
 from core.transaction_history import TransactionHistory
@@ -15,7 +16,7 @@ class TestTransactionHistory(unittest.TestCase):
     def setUp(self):
         """Create a temporary file for each test."""
         self.temp_dir = tempfile.mkdtemp()
-        self.temp_file = os.path.join(self.temp_dir, "data", "test_history.json")
+        self.temp_file = os.path.join(self.temp_dir, "data", "test_history.jsonl")
         self.history = TransactionHistory(filepath=self.temp_file)
 
     def tearDown(self):
@@ -119,21 +120,41 @@ class TestTransactionHistory(unittest.TestCase):
         self.assertEqual(len(entries), 1)
 
     def test_handles_missing_transactions_key(self):
-        """Test handling of file with missing transactions key."""
+        """Test handling of legacy file with missing transactions key."""
         with open(self.temp_file, 'w') as f:
             json.dump({"version": 1}, f)
 
-        entries = self.history.get_all()
+        entries = TransactionHistory(filepath=self.temp_file).get_all()
         self.assertEqual(entries, [])
 
+    def test_skips_unparseable_lines(self):
+        """Test that a partial/corrupt line doesn't lose the other entries."""
+        self.history.add(session_id="good", sender="!1", status="success")
+        with open(self.temp_file, 'a') as f:
+            f.write('{"session_id": "trunc')
+        with open(self.temp_file, 'rb') as f:
+            before = f.read()
+
+        reopened = TransactionHistory(filepath=self.temp_file)
+        self.assertEqual([e["session_id"] for e in reopened.get_all()], ["good"])
+        # Loading only reads - it must not race a concurrent writer by rewriting
+        with open(self.temp_file, 'rb') as f:
+            self.assertEqual(f.read(), before)
+
+        # An entry added after the torn line must survive the next load
+        reopened.add(session_id="after", sender="!1", status="success")
+        entries = TransactionHistory(filepath=self.temp_file).get_all()
+        self.assertEqual([e["session_id"] for e in entries], ["after", "good"])
+
     def test_filepath_property(self):
         """Test that filepath property returns correct path."""
         self.assertEqual(self.history.filepath, Path(self.temp_file))
 
-    def test_json_file_format(self):
-        """Test that the JSON file has correct structure."""
+    def test_jsonl_file_format(self):
+        """Test that each entry is stored as one JSON line, oldest first."""
+        self.history.add(session_id="first", sender="!1", status="success")
         self.history.add(
-            session_id="test",
+            session_id="second",
             sender="!sender",
             status="success",
             txid="txid123",
@@ -141,12 +162,107 @@ class TestTransactionHistory(unittest.TestCase):
         )
 
         with open(self.temp_file, 'r') as f:
-            data = json.load(f)
+            lines = f.read().splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["session_id"], "first")
+        self.assertEqual(json.loads(lines[1])["txid"], "txid123")
+
+    def test_add_appends_without_rereading_file(self):
+        """Test that add() only appends and get_all() is served from memory."""
+        self.history.add(session_id="a", sender="!1", status="success")
+
+        with unittest.mock.patch.object(
+            self.history, "_load_entries", side_effect=AssertionError("reloaded")
+        ):
+            self.history.add(session_id="b", sender="!2", status="success")
+            entries = self.history.get_all()
+
+        self.assertEqual([e["session_id"] for e in entries], ["b", "a"])
+
+    def test_get_recent_returns_newest_n(self):
+        """Test that get_recent() returns at most n entries, newest first."""
+        for name in ("a", "b", "c"):
+            self.history.add(session_id=name, sender="!1", status="success")
+
+        self.assertEqual([e["session_id"] for e in self.history.get_recent(2)], ["c", "b"])
+        self.assertEqual(len(self.history.get_recent(10)), 3)
+        self.assertEqual(self.history.get_recent(0), [])
+
+    def test_failed_rewrite_leaves_history_intact(self):
+        """Test that a crash while rewriting the file doesn't corrupt it."""
+        self.history.add(session_id="keep", sender="!1", status="success")
+
+        with unittest.mock.patch("core.transaction_history.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.history.clear()
+
+        entries = TransactionHistory(filepath=self.temp_file).get_all()
+        self.assertEqual([e["session_id"] for e in entries], ["keep"])
+
+    def test_fsync_only_when_requested(self):
+        """Test that writes are only fsynced when fsync=True."""
+        with unittest.mock.patch("core.transaction_history.os.fsync") as mock_fsync:
+            self.history.add(session_id="a", sender="!1", status="success")
+            mock_fsync.assert_not_called()
+
+            durable = TransactionHistory(filepath=self.temp_file, fsync=True)
+            durable.add(session_id="b", sender="!2", status="success")
+            mock_fsync.assert_called_once()
+
+    def test_get_all_returns_copy(self):
+        """Test that mutating the returned list doesn't affect stored history."""
+        self.history.add(session_id="a", sender="!1", status="success")
+        self.history.get_all().clear()
+        self.assertEqual(len(self.history.get_all()), 1)
 
-        self.assertIn("version", data)
-        self.assertEqual(data["version"], 1)
-        self.assertIn("transactions", data)
-        self.assertIsInstance(data["transactions"], list)
+
+class TestTransactionHistoryMigration(unittest.TestCase):
+    """Tests for migrating the legacy single-document JSON history."""
+
+    LEGACY = {
+        "version": 1,
+        "transactions": [
+            {"session_id": "newer", "sender": "!2", "status": "failed"},
+            {"session_id": "older", "sender": "!1", "status": "success"},
+        ],
+    }
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.temp_dir, "data")
+        os.makedirs(self.data_dir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_migrates_sibling_legacy_json_file(self):
+        """Test that a legacy .json next to a missing .jsonl is imported."""
+        with open(os.path.join(self.data_dir, "history.json"), 'w') as f:
+            json.dump(self.LEGACY, f, indent=2)
+
+        history = TransactionHistory(filepath=os.path.join(self.data_dir, "history.jsonl"))
+
+        self.assertEqual([e["session_id"] for e in history.get_all()], ["newer", "older"])
+        reloaded = TransactionHistory(filepath=history.filepath)
+        self.assertEqual([e["session_id"] for e in reloaded.get_all()], ["newer", "older"])
+
+    def test_migrates_legacy_format_in_place(self):
+        """Test that a file still in the legacy format is rewritten as JSONL."""
+        path = os.path.join(self.data_dir, "history.json")
+        with open(path, 'w') as f:
+            json.dump(self.LEGACY, f, indent=2)
+
+        history = TransactionHistory(filepath=path)
+        history.add(session_id="newest", sender="!3", status="success")
+
+        with open(path, 'r') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(
+            [json.loads(line)["session_id"] for line in lines],
+            ["older", "newer", "newest"],
+        )
 
 
 class TestTransactionHistoryThreadSafety(unittest.TestCase):
@@ -155,7 +271,7 @@ class TestTransactionHistoryThreadSafety(unittest.TestCase):
     def setUp(self):
         """Create a temporary file for each test."""
         self.temp_dir = tempfile.mkdtemp()
-        self.temp_file = os.path.join(self.temp_dir, "data", "thread_test.json")
+        self.temp_file = os.path.join(self.temp_dir, "data", "thread_test.jsonl")
         self.history = TransactionHistory(filepath=self.temp_file)
 
     def tearDown(self):
@@ -44,6 +44,42 @@ class TestTransactionDecodeStory23(unittest.TestCase):
         self.assertEqual(result["output_count"], 1)
         self.assertEqual(result["locktime"], 0)
 
+    def test_segwit_transaction_with_multibyte_varint_scriptsig(self):
+        """Given a SegWit tx whose scriptSig length uses the 0xFD varint form, When decoded, Then counts are correct."""
+        raw_hex = (
+            "02000000"
+            + "0001"  # SegWit marker + flag
+            + "02"  # input count
+            + "11" * 32 + "00000000" + "fd0001" + "ab" * 256 + "ffffffff"
+            + "22" * 32 + "01000000" + "00" + "ffffffff"
+            + "03"  # output count
+            + ("00e1f50500000000" + "00") * 3
+            + "0000"  # empty witness stacks
+            + "efbeadde"  # locktime
+        )
+        result = self.decode(raw_hex)
+        self.assertEqual(result["version"], 2)
+        self.assertTrue(result["is_segwit"])
+        self.assertEqual(result["input_count"], 2)
+        self.assertEqual(result["output_count"], 3)
+        self.assertEqual(result["locktime"], 0xDEADBEEF)
+
+    def test_read_varint_widths(self):
+        """Given each varint encoding width, When read, Then value and next offset are correct."""
+        from core.transaction_parser import read_varint
+
+        self.assertEqual(read_varint(bytes.fromhex("fc"), 0), (0xFC, 1))
+        self.assertEqual(read_varint(bytes.fromhex("fd0302"), 0), (0x0203, 3))
+        self.assertEqual(read_varint(bytes.fromhex("fe04030201"), 0), (0x01020304, 5))
+        self.assertEqual(
+            read_varint(bytes.fromhex("00ff0807060504030201"), 1), (0x0102030405060708, 10)
+        )
+
+    def test_truncated_varint_raises_value_error(self):
+        """Given a tx truncated inside a multi-byte varint, When decoded, Then ValueError is raised."""
+        with self.assertRaises(ValueError):
+            self.decode("01000000" + "fd01")
+
     def test_malformed_raw_transaction_hex(self):
         """Given a malformed raw transaction hex, When decoded, Then it raises ValueError and logs error."""
         bad_hex = "deadbeef"  # Too short to be a valid tx
@@ -51,6 +87,47 @@ class TestTransactionDecodeStory23(unittest.TestCase):
             self.decode(bad_hex)
 
 
+class TestQuickReject(unittest.TestCase):
+    # version 1, 1 input (empty scriptSig), 1 output (empty script), locktime 0
+    VALID = "01000000" + "01" + "00" * 36 + "00" + "ffffffff" + "01" + "00" * 9 + "00000000"
+
+    def setUp(self):
+        from core.transaction_parser import quick_reject
+
+        self.quick_reject = quick_reject
+
+    def test_plausible_tx_not_rejected(self):
+        """Given a well-formed minimal tx, When checked, Then it is not rejected."""
+        self.assertIsNone(self.quick_reject(self.VALID))
+
+    def test_short_hex_rejected(self):
+        """Given hex shorter than the smallest possible tx, When checked, Then it is rejected."""
+        self.assertEqual(self.quick_reject(self.VALID[:-2]), "Transaction too short")
+
+    def test_non_hex_rejected(self):
+        """Given non-hex characters or an odd length, When checked, Then it is rejected as invalid hex."""
+        self.assertEqual(self.quick_reject("g" + self.VALID[1:]), "Invalid hex")
+        self.assertEqual(self.quick_reject(self.VALID + "0"), "Invalid hex")
+
+    def test_zero_inputs_rejected(self):
+        """Given a zero input count, with or without SegWit marker, When checked, Then it is rejected."""
+        self.assertEqual(self.quick_reject("01000000" + "00" + "02" + "00" * 60), "No inputs")
+        self.assertEqual(self.quick_reject("02000000" + "0001" + "00" + "00" * 60), "No inputs")
+
+
+class TestIsHex(unittest.TestCase):
+    def test_is_hex(self):
+        """Given various strings, When checked, Then only strings of hex digits pass."""
+        from core.transaction_parser import is_hex
+
+        self.assertTrue(is_hex("0123456789abcdefABCDEF"))
+        self.assertTrue(is_hex(""))
+        self.assertFalse(is_hex("abcg"))
+        self.assertFalse(is_hex("ab cd"))
+        self.assertFalse(is_hex("ab\u00e9"))
+        self.assertFalse(is_hex("\uff10\uff11"))  # full-width digits
+
+
 class TestTransactionSanityChecksStory31(unittest.TestCase):
     def setUp(self):
         self.valid_tx = {